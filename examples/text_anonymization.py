@@ -1,12 +1,22 @@
+import sys
+from functools import cache
+
 from presidio_anonymizer.entities import OperatorConfig
 
 from cn_pii_anonymization import TextProcessor
 from cn_pii_anonymization.operators import CNFakeOperator, CNMaskOperator
 
+# 操作符实例在模块加载时创建一次，避免每个PII实体都重新构造Faker
+_FAKE_OP = CNFakeOperator()
+_MASK_OP = CNMaskOperator()
+
 
+@cache
 def create_fake_operator_config(entity_type: str) -> OperatorConfig:
     """
     创建假名替换操作符配置
+
+    同一实体类型的配置只创建一次，重复调用返回缓存的对象。
     
     Args:
         entity_type: PII实体类型，如 CN_NAME, CN_PHONE_NUMBER 等
@@ -16,7 +26,7 @@ def create_fake_operator_config(entity_type: str) -> OperatorConfig:
     """
     return OperatorConfig(
         "custom",
-        {"lambda": lambda x: CNFakeOperator().operate(x, {"entity_type": entity_type})},
+        {"lambda": lambda x: _FAKE_OP.operate(x, {"entity_type": entity_type})},
     )
 
 
@@ -35,9 +45,7 @@ def demo_mixed_operators():
         "CN_PHONE_NUMBER": OperatorConfig(
             "custom",
             {
-                "lambda": lambda x: CNMaskOperator().operate(
-                    x, {"keep_prefix": 3, "keep_suffix": 4}
-                )
+                "lambda": lambda x: _MASK_OP.operate(x, {"keep_prefix": 3, "keep_suffix": 4})
             },
         ),
         # 姓名：假名替换
@@ -59,6 +67,13 @@ def demo_mixed_operators():
 
     print(f"原始文本: {text}")
     print(f"处理后文本: {result.anonymized_text}")
+    # 实体明细拼接后一次性输出
+    sys.stdout.write(
+        "".join(
+            f"  - {e.entity_type}: '{e.original_text}' -> '{e.anonymized_text}'\n"
+            for e in result.pii_entities
+        )
+    )
     print("说明：手机号使用掩码，姓名和身份证使用假名替换")
     print()
 
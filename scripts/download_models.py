@@ -8,23 +8,17 @@
     uv run python scripts/download_models.py
 """
 
-import os
-
-os.environ["FLAGS_use_mkldnn"] = "0"
-os.environ["FLAGS_enable_onednn_backend"] = "0"
-os.environ["FLAGS_disable_onednn_backend"] = "1"
-os.environ["FLAGS_enable_pir_api"] = "0"
-os.environ["FLAGS_json_format_model"] = "0"
-os.environ["PADDLE_PDX_USE_PIR_TRT"] = "0"
-os.environ["PADDLE_PDX_ENABLE_MKLDNN_BYDEFAULT"] = "0"
-os.environ["PADDLE_PDX_MODEL_SOURCE"] = "bos"
-
 import functools
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import cn_pii_anonymization.utils.paddle_env  # noqa: F401  # isort: skip
+
+from cn_pii_anonymization.config.settings import settings
 from cn_pii_anonymization.utils.logger import get_logger, setup_logging
 
 setup_logging()
@@ -90,26 +84,33 @@ def download_paddlenlp_models() -> None:
 
 
 def download_paddleocr_models() -> None:
-    """下载PaddleOCR模型"""
+    """
+    下载PaddleOCR模型
+
+    模型版本与服务运行时一致（读取OCR_VERSION配置），
+    且与OCR引擎一样不加载文本行方向分类模型。
+    """
     logger.info("=" * 50)
-    logger.info("开始下载 PaddleOCR 模型...")
+    logger.info(f"开始下载 PaddleOCR 模型 ({settings.ocr_version})...")
     logger.info("=" * 50)
 
     try:
         from paddleocr import PaddleOCR
 
         ocr = PaddleOCR(
-            lang="ch",
-            use_textline_orientation=True,
+            lang=settings.ocr_language,
+            use_textline_orientation=False,
+            use_doc_orientation_classify=False,
+            use_doc_unwarping=False,
             device="cpu",
-            ocr_version="PP-OCRv4",
+            ocr_version=settings.ocr_version,
         )
 
         import numpy as np
         from PIL import Image
 
         test_image = Image.new("RGB", (100, 50), color=(255, 255, 255))
-        ocr.ocr(np.array(test_image))
+        ocr.ocr(np.asarray(test_image))
 
         logger.info("PaddleOCR 模型下载完成!")
     except Exception as e:
@@ -123,8 +124,14 @@ def main() -> None:
     logger.info("开始预下载所有模型...")
     logger.info("=" * 60)
 
-    download_paddlenlp_models()
-    download_paddleocr_models()
+    # 两类模型来自不同的仓库，下载过程以网络I/O为主，并发执行
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(download_paddlenlp_models),
+            executor.submit(download_paddleocr_models),
+        ]
+        for future in as_completed(futures):
+            future.result()
 
     logger.info("=" * 60)
     logger.info("所有模型下载完成!")
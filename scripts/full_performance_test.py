@@ -4,7 +4,10 @@
 测试完整的图像脱敏流程，包括初始化时间。
 """
 
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from PIL import Image
@@ -16,18 +19,61 @@ setup_logging()
 logger = get_logger(__name__)
 
 
-def test_full_performance(image_path: str, iterations: int = 3) -> dict:
+# 工作进程内复用的引擎与图像，由 _init_worker 初始化
+_worker_engine: CNPIIImageRedactorEngine | None = None
+_worker_image: Image.Image | None = None
+
+
+def _init_worker(image_path: str) -> None:
+    """
+    工作进程初始化：加载图像并预热引擎
+
+    脱敏引擎内部的识别器共享IE缓存，不能在多线程间并发调用，
+    因此并行测试时每个进程持有独立的引擎实例。
+
+    Args:
+        image_path: 图像文件路径
+    """
+    global _worker_engine, _worker_image
+    _worker_image = Image.open(image_path)
+    _worker_image.load()
+    _worker_engine = CNPIIImageRedactorEngine()
+    _worker_engine.redact(_worker_image)
+
+
+def _timed_redact(iteration: int) -> dict:
+    """
+    在工作进程中执行一次脱敏并计时
+
+    Args:
+        iteration: 迭代序号
+
+    Returns:
+        单次运行结果
+    """
+    start = time.perf_counter_ns()
+    _worker_engine.redact(_worker_image)
+    return {"iteration": iteration, "redact_time": (time.perf_counter_ns() - start) / 1e9}
+
+
+def test_full_performance(image_path: str, iterations: int = 3, workers: int = 1) -> dict:
     """
     测试完整性能
 
+    引擎只初始化一次：先测量冷启动（初始化 + 首次脱敏），
+    再复用同一个引擎测量稳态脱敏耗时。
+    workers大于1时，热运行在多个预热好的工作进程中并行执行。
+
     Args:
         image_path: 图像文件路径
-        iterations: 测试迭代次数
+        iterations: 热运行迭代次数
+        workers: 热运行并行进程数
 
     Returns:
         性能测试结果
     """
     image = Image.open(image_path)
+    image.load()
     logger.info(f"图像尺寸: {image.size}")
 
     results = {
@@ -37,58 +83,74 @@ def test_full_performance(image_path: str, iterations: int = 3) -> dict:
         "runs": [],
     }
 
-    for i in range(iterations):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"第 {i+1}/{iterations} 次测试")
-        logger.info(f"{'='*60}")
-
-        # 重置单例
-        CNPIIImageRedactorEngine.reset()
-
-        run_result = {"iteration": i + 1}
-
-        # 完整流程计时
-        start_total = time.time()
-
-        # 1. 初始化
-        start = time.time()
-        engine = CNPIIImageRedactorEngine()
-        init_time = time.time() - start
-        run_result["init_time"] = init_time
-        logger.info(f"[1] 引擎初始化: {init_time:.2f}s")
-
-        # 2. 完整脱敏
-        start = time.time()
-        redacted = engine.redact(image)
-        redact_time = time.time() - start
-        run_result["redact_time"] = redact_time
-        logger.info(f"[2] 脱敏处理: {redact_time:.2f}s")
-
-        total_time = time.time() - start_total
-        run_result["total_time"] = total_time
-        logger.info(f"[总] 完整耗时: {total_time:.2f}s")
-
-        results["runs"].append(run_result)
+    # 冷启动：初始化 + 首次脱敏（只执行一次）
+    CNPIIImageRedactorEngine.reset()
+
+    start = time.perf_counter_ns()
+    engine = CNPIIImageRedactorEngine()
+    init_time = (time.perf_counter_ns() - start) / 1e9
+    logger.info(f"[冷启动] 引擎初始化: {init_time:.2f}s")
+
+    start = time.perf_counter_ns()
+    engine.redact(image)
+    first_redact_time = (time.perf_counter_ns() - start) / 1e9
+    logger.info(f"[冷启动] 首次脱敏处理: {first_redact_time:.2f}s")
+
+    cold_total_time = init_time + first_redact_time
+    logger.info(f"[冷启动] 完整耗时: {cold_total_time:.2f}s")
+
+    if workers > 1:
+        # 热运行：多个预热好的工作进程并行脱敏，单次耗时在工作进程内测量
+        workers = min(workers, iterations, os.cpu_count() or 1)
+        logger.info(f"[热运行] 使用 {workers} 个工作进程并行测试")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(image_path,),
+        ) as executor:
+            results["runs"] = list(executor.map(_timed_redact, range(1, iterations + 1)))
+        for run_result in results["runs"]:
+            logger.info(
+                f"[热运行] 第 {run_result['iteration']}/{iterations} 次脱敏处理: "
+                f"{run_result['redact_time']:.2f}s"
+            )
+    else:
+        # 热运行：复用同一个引擎，仅测量脱敏处理耗时
+        for i in range(iterations):
+            logger.info(f"\n{'='*60}")
+            logger.info(f"第 {i+1}/{iterations} 次测试")
+            logger.info(f"{'='*60}")
+
+            run_result = {"iteration": i + 1}
+
+            start = time.perf_counter_ns()
+            engine.redact(image)
+            redact_time = (time.perf_counter_ns() - start) / 1e9
+            run_result["redact_time"] = redact_time
+            logger.info(f"[热运行] 脱敏处理: {redact_time:.2f}s")
+
+            results["runs"].append(run_result)
 
     # 计算平均值
-    avg_init = sum(r["init_time"] for r in results["runs"]) / iterations
     avg_redact = sum(r["redact_time"] for r in results["runs"]) / iterations
-    avg_total = sum(r["total_time"] for r in results["runs"]) / iterations
 
     results["summary"] = {
-        "avg_init_time": avg_init,
+        "init_time": init_time,
+        "first_redact_time": first_redact_time,
+        "cold_total_time": cold_total_time,
         "avg_redact_time": avg_redact,
-        "avg_total_time": avg_total,
     }
 
     logger.info(f"\n{'='*60}")
     logger.info("性能测试总结")
     logger.info(f"{'='*60}")
-    logger.info(f"平均初始化时间: {avg_init:.2f}s")
-    logger.info(f"平均脱敏处理时间: {avg_redact:.2f}s")
-    logger.info(f"平均完整耗时: {avg_total:.2f}s")
+    logger.info(f"初始化时间: {init_time:.2f}s")
+    logger.info(f"首次脱敏处理时间: {first_redact_time:.2f}s")
+    logger.info(f"冷启动完整耗时: {cold_total_time:.2f}s")
+    logger.info(f"热运行平均脱敏处理时间: {avg_redact:.2f}s")
     logger.info(f"目标: < 30s")
-    logger.info(f"结果: {'✓ 达标' if avg_total < 30 else '✗ 未达标'}")
+    logger.info(f"结果: {'✓ 达标' if cold_total_time < 30 else '✗ 未达标'}")
 
     return results
 
@@ -20,7 +20,7 @@ print("=" * 60)
 try:
     print("\n正在初始化 PaddleOCR...")
     ocr = PaddleOCR(
-        use_angle_cls=True,
+        use_angle_cls=False,  # 测试图像文字水平，无需方向分类
         lang="ch",
         enable_mkldnn=False,
     )
@@ -30,7 +30,7 @@ try:
     test_image = Image.new("RGB", (200, 100), color=(255, 255, 255))
     
     print("正在执行 OCR 识别...")
-    result = ocr.ocr(np.array(test_image))
+    result = ocr.ocr(np.asarray(test_image))
     
     print("\nOCR 识别成功!")
     print(f"结果: {result}")
@@ -0,0 +1,41 @@
+"""
+CN PII Anonymization 服务入口
+
+提供API服务启动入口，可通过 `python -m cn_pii_anonymization` 或 `cn-pii` 命令运行。
+"""
+
+import cn_pii_anonymization.utils.paddle_env  # noqa: F401  # isort: skip
+
+import uvicorn
+
+from cn_pii_anonymization.config.settings import settings
+from cn_pii_anonymization.utils.logger import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    """
+    启动API服务
+    """
+    setup_logging()
+
+    logger.info(f"启动 {settings.app_name} v{settings.app_version}")
+    logger.info(f"服务地址: http://{settings.api_host}:{settings.api_port}")
+    logger.info(f"API文档: http://{settings.api_host}:{settings.api_port}/docs")
+
+    uvicorn.run(
+        "cn_pii_anonymization.api.app:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        reload=settings.debug,
+        log_level=settings.log_level.lower(),
+        # 安装 uvicorn[standard] 后自动使用 uvloop 与 httptools
+        loop="auto",
+        http="auto",
+        workers=None if settings.debug else settings.api_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
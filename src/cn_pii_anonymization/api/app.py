@@ -4,10 +4,7 @@ FastAPI应用入口
 提供API服务的入口点，配置中间件和路由。
 """
 
-import os
-
-os.environ["FLAGS_USE_MKLDNN"] = "0"
-os.environ["FLAGS_ENABLE_ONEDNN_BACKEND"] = "0"
+import cn_pii_anonymization.utils.paddle_env  # noqa: F401  # isort: skip
 
 from contextlib import asynccontextmanager
 
@@ -15,30 +12,100 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from cn_pii_anonymization.api.executor import run_in_engine_thread
 from cn_pii_anonymization.api.middleware import LoggingMiddleware
 from cn_pii_anonymization.api.routes import image_router, text_router
 from cn_pii_anonymization.api.schemas import APIResponse, ErrorResponse, HealthCheckData
 from cn_pii_anonymization.config.settings import settings
+from cn_pii_anonymization.core.analyzer import CNPIIAnalyzerEngine
+from cn_pii_anonymization.processors.image_processor import ImageProcessor
+from cn_pii_anonymization.processors.text_processor import TextProcessor
 from cn_pii_anonymization.utils.exceptions import CNPIIError
-from cn_pii_anonymization.utils.logger import get_logger
+from cn_pii_anonymization.utils.logger import ensure_logging, get_logger
 
 logger = get_logger(__name__)
 
 
+def _select_json_response_class() -> type[JSONResponse]:
+    """
+    选择JSON响应类
+
+    orjson可用时使用ORJSONResponse序列化响应。新版FastAPI已直接通过Pydantic
+    序列化response_model并弃用ORJSONResponse，此时沿用默认的JSONResponse。
+
+    Returns:
+        JSON响应类
+    """
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+    except ImportError:
+        return JSONResponse
+
+    if hasattr(ORJSONResponse, "__deprecated__"):
+        return JSONResponse
+    return ORJSONResponse
+
+
+DefaultJSONResponse = _select_json_response_class()
+
+
+def _warm_ie_engine() -> None:
+    """
+    预加载信息抽取模型
+
+    创建分析器单例并加载其信息抽取引擎，避免首个请求承担模型加载耗时。
+    在引擎线程中执行，不阻塞事件循环。
+    """
+    try:
+        ie_engine = CNPIIAnalyzerEngine().get_ie_engine()
+        if ie_engine is not None:
+            ie_engine.load()
+        logger.info("信息抽取模型预加载完成")
+    except Exception as e:
+        logger.warning(f"信息抽取模型预加载失败，将在首次请求时加载: {e}")
+
+
+def _init_processors(app: FastAPI) -> None:
+    """
+    创建文本和图像处理器
+
+    处理器保存在app.state上供路由依赖获取，避免首个请求在事件循环中
+    同步承担引擎初始化耗时。在引擎线程中执行，不阻塞事件循环。
+
+    Args:
+        app: FastAPI应用实例
+    """
+    app.state.text_processor = TextProcessor()
+    app.state.image_processor = ImageProcessor()
+    logger.info("文本和图像处理器初始化完成")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     应用生命周期管理
 
     在应用启动时初始化资源，在应用关闭时清理资源。
+    启用nlp_preload时，先在引擎线程中加载信息抽取模型，
+    随后在同一线程中创建文本和图像处理器。
+    日志由后台线程异步写入，关闭时等待队列中的日志全部写出。
     """
+    ensure_logging()
+
     logger.info(f"启动 {settings.app_name} v{settings.app_version}")
     logger.info(f"调试模式: {settings.debug}")
     logger.info(f"日志级别: {settings.log_level}")
 
+    if settings.nlp_preload:
+        await run_in_engine_thread(_warm_ie_engine)
+
+    await run_in_engine_thread(_init_processors, app)
+
     yield
 
     logger.info(f"关闭 {settings.app_name}")
+    await logger.complete()
 
 
 app = FastAPI(
@@ -48,6 +115,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=DefaultJSONResponse,
     lifespan=lifespan,
 )
 
@@ -78,9 +146,9 @@ async def pii_exception_handler(request: Request, exc: CNPIIError) -> JSONRespon
         message=exc.message,
         error_type=type(exc).__name__,
     )
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=400,
-        content=error_response.model_dump(),
+        content=error_response.model_dump(mode="json"),
     )
 
 
@@ -96,9 +164,9 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         message=exc.detail,
         error_type="HTTPException",
     )
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump(),
+        content=error_response.model_dump(mode="json"),
     )
 
 
@@ -115,9 +183,9 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         message=str(exc) if settings.debug else "服务器内部错误",
         error_type=type(exc).__name__,
     )
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=500,
-        content=error_response.model_dump(),
+        content=error_response.model_dump(mode="json"),
     )
 
 
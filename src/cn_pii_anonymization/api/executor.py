@@ -0,0 +1,36 @@
+"""
+引擎执行器模块
+
+在专用后台线程中执行PII识别与脱敏等CPU密集型调用，避免阻塞事件循环。
+"""
+
+import asyncio
+import contextvars
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+# 分析器、OCR引擎与脱敏引擎均为进程内单例，内部共享IE缓存与最近一次的OCR结果，
+# 不能并发调用，因此所有引擎调用在同一个线程中串行执行。
+# 多核并行通过启动多个工作进程（API_WORKERS）实现。
+_engine_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cn-pii-engine")
+
+
+async def run_in_engine_thread[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    在引擎线程中执行同步调用
+
+    调用在当前上下文的副本中执行，request_id等上下文变量在引擎线程中保持可用。
+
+    Args:
+        func: 要执行的同步函数
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        函数的返回值
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_engine_executor, partial(ctx.run, func, *args, **kwargs))
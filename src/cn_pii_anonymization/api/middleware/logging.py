@@ -5,70 +5,107 @@
 """
 
 import time
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from cn_pii_anonymization.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# ASGI响应头为bytes元组，头名称在模块加载时编码一次
+_PROCESS_TIME_HEADER = b"x-process-time"
+_REQUEST_ID_HEADER = b"x-request-id"
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+
+class LoggingMiddleware:
     """
     日志中间件
 
     记录所有HTTP请求的详细信息，包括请求方法、路径、状态码和处理时间。
+    以纯ASGI中间件实现，直接从scope读取请求信息，并在响应开始时注入响应头，
+    避免BaseHTTPMiddleware为每个请求额外创建任务和包装请求/响应对象。
+    请求处理期间通过logger.contextualize绑定request_id，下游日志无需再手动携带。
 
     Example:
         >>> app = FastAPI()
         >>> app.add_middleware(LoggingMiddleware)
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
         """
-        处理请求并记录日志
+        初始化日志中间件
 
         Args:
-            request: HTTP请求对象
-            call_next: 下一个中间件或路由处理函数
-
-        Returns:
-            HTTP响应对象
+            app: 下游ASGI应用
         """
-        start_time = time.time()
-
-        request_id = id(request)
-        method = request.method
-        url = str(request.url)
-        client_host = request.client.host if request.client else "unknown"
-
-        logger.info(f"[{request_id}] 请求开始: {method} {url} - 客户端: {client_host}")
-
-        try:
-            response = await call_next(request)
+        self.app = app
 
-            process_time = time.time() - start_time
-            status_code = response.status_code
-
-            log_level = "info" if status_code < 400 else "warning" if status_code < 500 else "error"
-            getattr(logger, log_level)(
-                f"[{request_id}] 请求完成: {method} {url} - "
-                f"状态码: {status_code} - 耗时: {process_time:.3f}s"
-            )
-
-            response.headers["X-Process-Time"] = f"{process_time:.3f}"
-            response.headers["X-Request-ID"] = str(request_id)
-
-            return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        处理请求并记录日志
 
-        except Exception as e:
-            process_time = time.time() - start_time
-            logger.error(
-                f"[{request_id}] 请求异常: {method} {url} - 错误: {e} - 耗时: {process_time:.3f}s"
-            )
-            raise
+        Args:
+            scope: ASGI连接信息
+            receive: ASGI接收通道
+            send: ASGI发送通道
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        request_id = id(scope)
+        method = scope["method"]
+        url = scope["path"]
+        if scope.get("query_string"):
+            url = f"{url}?{scope['query_string'].decode('latin-1')}"
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+
+        # request_id通过contextvars绑定到请求内的所有日志（包括路由和引擎线程中的日志）
+        with logger.contextualize(request_id=request_id):
+            logger.info("请求开始: {} {} - 客户端: {}", method, url, client_host)
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    process_time = time.perf_counter() - start_time
+                    status_code = message["status"]
+
+                    if status_code < 400:
+                        log = logger.info
+                    elif status_code < 500:
+                        log = logger.warning
+                    else:
+                        log = logger.error
+                    log(
+                        "请求完成: {} {} - 状态码: {} - 耗时: {:.3f}s",
+                        method,
+                        url,
+                        status_code,
+                        process_time,
+                    )
+
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (_PROCESS_TIME_HEADER, b"%.3f" % process_time),
+                        (_REQUEST_ID_HEADER, b"%d" % request_id),
+                    ]
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as e:
+                process_time = time.perf_counter() - start_time
+                logger.error(
+                    "请求异常: {} {} - 错误: {} - 耗时: {:.3f}s",
+                    method,
+                    url,
+                    e,
+                    process_time,
+                )
+                raise
 
 
 class CORSMiddleware:
@@ -4,13 +4,19 @@
 提供图像PII识别和脱敏的API端点。
 """
 
+import json
+import os
+from collections.abc import Callable
+from functools import lru_cache
 from io import BytesIO
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import Response
 from PIL import Image
+from pydantic import TypeAdapter
 
+from cn_pii_anonymization.api.executor import run_in_engine_thread
 from cn_pii_anonymization.api.schemas import (
     APIResponse,
     ImageAnalyzeData,
@@ -18,8 +24,9 @@ from cn_pii_anonymization.api.schemas import (
     ImagePIIEntityResponse,
 )
 from cn_pii_anonymization.config.settings import settings
+from cn_pii_anonymization.ocr.ocr_engine import OCRResult
 from cn_pii_anonymization.operators.mosaic_operator import MosaicStyle
-from cn_pii_anonymization.processors.image_processor import ImageProcessor
+from cn_pii_anonymization.processors.image_processor import ImagePIIEntity, ImageProcessor
 from cn_pii_anonymization.utils.exceptions import (
     OCRError,
     UnsupportedImageFormatError,
@@ -28,17 +35,54 @@ from cn_pii_anonymization.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# orjson可用时用于解析表单中的JSON数组，其JSONDecodeError是json.JSONDecodeError的子类
+json_loads: Callable[[str], Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 router = APIRouter(prefix="/image", tags=["图像处理"])
 
-_image_processor: ImageProcessor | None = None
+# 错误提示中的支持格式列表只拼接一次
+_SUPPORTED_FORMATS_TEXT = ", ".join(sorted(settings.supported_image_formats))
+
+# 实体列表整体交给pydantic-core校验，比逐个构造模型实例更快
+_IMAGE_ENTITY_LIST_ADAPTER = TypeAdapter(list[ImagePIIEntityResponse])
+
+_MOSAIC_STYLE_DESCRIPTIONS: dict[str, str] = {
+    "pixel": "像素块马赛克 - 将区域划分为像素块并取平均色",
+    "blur": "高斯模糊 - 对区域应用高斯模糊效果",
+    "fill": "纯色填充 - 用指定颜色覆盖区域",
+}
 
+# 马赛克样式列表是静态的，在模块加载时构建一次
+_MOSAIC_STYLES_DATA: dict[str, list[dict[str, str]]] = {
+    "styles": [
+        {"name": style.value, "description": _MOSAIC_STYLE_DESCRIPTIONS.get(style.value, "")}
+        for style in MosaicStyle
+    ]
+}
 
-def get_image_processor() -> ImageProcessor:
-    """获取图像处理器单例"""
-    global _image_processor
-    if _image_processor is None:
-        _image_processor = ImageProcessor()
-    return _image_processor
+
+def get_image_processor(request: Request) -> ImageProcessor:
+    """
+    获取图像处理器
+
+    处理器在应用启动时创建并保存在app.state上；未经过lifespan启动时
+    （如未使用上下文管理器的TestClient）在首次请求时创建。
+
+    Args:
+        request: 当前请求
+
+    Returns:
+        图像处理器实例
+    """
+    state = request.app.state
+    processor = getattr(state, "image_processor", None)
+    if processor is None:
+        processor = state.image_processor = ImageProcessor()
+    return processor
 
 
 def validate_image_file(file: UploadFile) -> None:
@@ -46,14 +90,66 @@ def validate_image_file(file: UploadFile) -> None:
     if not file.filename:
         raise HTTPException(status_code=400, detail="文件名不能为空")
 
-    ext = file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
+    ext = file.filename.rpartition(".")[2].lower() if "." in file.filename else ""
     if ext not in settings.supported_image_formats:
         raise HTTPException(
             status_code=400,
-            detail=f"不支持的图像格式: {ext}。支持的格式: {', '.join(settings.supported_image_formats)}",
+            detail=f"不支持的图像格式: {ext}。支持的格式: {_SUPPORTED_FORMATS_TEXT}",
         )
 
 
+@lru_cache(maxsize=32)
+def parse_fill_color(fill_color: str) -> tuple[int, int, int]:
+    """
+    解析纯色填充颜色
+
+    请求中的颜色取值集中在少数几种，按原始字符串缓存解析结果。
+
+    Args:
+        fill_color: 颜色字符串，格式: R,G,B
+
+    Returns:
+        RGB颜色元组
+
+    Raises:
+        ValueError: 颜色格式错误
+    """
+    color = tuple(int(c.strip()) for c in fill_color.split(","))
+    if len(color) != 3:
+        raise ValueError("颜色格式错误")
+    return color
+
+
+def open_upload_image(file: UploadFile) -> Image.Image:
+    """
+    校验上传图像的大小并打开图像
+
+    优先使用UploadFile.size获取大小，未知时通过seek/tell获取，
+    然后直接从上传的临时文件解码，避免将整份图像再复制为bytes。
+
+    Args:
+        file: 上传的图像文件
+
+    Returns:
+        PIL图像对象
+
+    Raises:
+        HTTPException: 图像大小超出限制时抛出
+    """
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)
+
+    if size > settings.max_image_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"图像大小超出限制: {size / (1024 * 1024):.2f}MB > {settings.max_image_size / (1024 * 1024):.2f}MB",
+        )
+
+    return Image.open(file.file)
+
+
 @router.post(
     "/anonymize",
     summary="图像PII脱敏",
@@ -63,6 +159,7 @@ def validate_image_file(file: UploadFile) -> None:
 )
 async def anonymize_image(
     image: Annotated[UploadFile, File(..., description="要处理的图像文件")],
+    processor: Annotated[ImageProcessor, Depends(get_image_processor)],
     mosaic_style: Annotated[
         str,
         Form(description="马赛克样式: pixel(像素块), blur(模糊), fill(纯色填充)"),
@@ -87,12 +184,13 @@ async def anonymize_image(
         bool,
         Form(description="是否返回元数据（PII实体信息）"),
     ] = False,
-) -> StreamingResponse | APIResponse:
+) -> Response:
     """
     图像PII脱敏
 
     Args:
         image: 上传的图像文件
+        processor: 图像处理器
         mosaic_style: 马赛克样式 (pixel/blur/fill)
         fill_color: 纯色填充颜色 (R,G,B)
         entities: 要识别的PII类型列表
@@ -103,27 +201,25 @@ async def anonymize_image(
     Returns:
         处理后的图像文件或包含元数据的响应
     """
-    import json
-
-    logger.info(f"收到图像脱敏请求: filename={image.filename}, mosaic_style={mosaic_style}")
+    logger.info("收到图像脱敏请求: filename={}, mosaic_style={}", image.filename, mosaic_style)
 
     validate_image_file(image)
 
     try:
-        image_bytes = await image.read()
-
-        if len(image_bytes) > settings.max_image_size:
+        try:
+            style = MosaicStyle(mosaic_style)
+        except ValueError:
             raise HTTPException(
                 status_code=400,
-                detail=f"图像大小超出限制: {len(image_bytes) / (1024 * 1024):.2f}MB > {settings.max_image_size / (1024 * 1024):.2f}MB",
-            )
+                detail=f"不支持的马赛克样式: {mosaic_style}，支持: {', '.join(MosaicStyle)}",
+            ) from None
 
-        pil_image = Image.open(BytesIO(image_bytes))
+        pil_image = open_upload_image(image)
 
         entities_list: list[str] | None = None
         if entities:
             try:
-                entities_list = json.loads(entities)
+                entities_list = json_loads(entities)
             except json.JSONDecodeError:
                 raise HTTPException(
                     status_code=400, detail="entities格式错误，应为JSON数组"
@@ -132,26 +228,24 @@ async def anonymize_image(
         allow_list_data: list[str] | None = None
         if allow_list:
             try:
-                allow_list_data = json.loads(allow_list)
+                allow_list_data = json_loads(allow_list)
             except json.JSONDecodeError:
                 raise HTTPException(
                     status_code=400, detail="allow_list格式错误，应为JSON数组"
                 ) from None
 
         try:
-            fill_color_tuple = tuple(int(c.strip()) for c in fill_color.split(","))
-            if len(fill_color_tuple) != 3:
-                raise ValueError("颜色格式错误")
+            fill_color_tuple = parse_fill_color(fill_color)
         except ValueError:
             raise HTTPException(
                 status_code=400,
                 detail="fill_color格式错误，应为: R,G,B，如: 0,0,0",
             ) from None
 
-        processor = get_image_processor()
-        result = processor.process(
+        result = await run_in_engine_thread(
+            processor.process,
             image=pil_image,
-            mosaic_style=mosaic_style,
+            mosaic_style=style,
             fill_color=fill_color_tuple,
             entities=entities_list,
             allow_list=allow_list_data,
@@ -159,20 +253,17 @@ async def anonymize_image(
         )
 
         if return_metadata:
-            pii_entities = [
-                ImagePIIEntityResponse(
-                    entity_type=entity.entity_type,
-                    text=entity.text,
-                    bbox={
-                        "left": entity.bbox[0],
-                        "top": entity.bbox[1],
-                        "width": entity.bbox[2],
-                        "height": entity.bbox[3],
-                    },
-                    score=entity.score,
-                )
-                for entity in result.pii_entities
-            ]
+            pii_entities = _IMAGE_ENTITY_LIST_ADAPTER.validate_python(
+                [
+                    {
+                        "entity_type": entity.entity_type,
+                        "text": entity.text,
+                        "bbox": entity.bbox,
+                        "score": entity.score,
+                    }
+                    for entity in result.pii_entities
+                ]
+            )
 
             data = ImageAnonymizeData(
                 pii_entities=pii_entities,
@@ -180,37 +271,39 @@ async def anonymize_image(
                 ocr_confidence=result.ocr_result.confidence if result.ocr_result else 0.0,
             )
 
-            return APIResponse(
-                code=200,
-                message="success",
-                data=data.model_dump(),
+            # 该端点未声明response_model，直接由Pydantic序列化为JSON，跳过jsonable_encoder
+            return Response(
+                content=APIResponse(code=200, message="success", data=data).model_dump_json(),
+                media_type="application/json",
             )
 
+        pii_count = len(result.pii_entities)
+
+        # 以最低压缩级别编码PNG，显著降低编码耗时（文件略大）
         output_buffer = BytesIO()
-        result.processed_image.save(output_buffer, format="PNG")
-        output_buffer.seek(0)
+        result.processed_image.save(output_buffer, format="PNG", compress_level=1)
 
-        logger.info(f"图像脱敏完成: 发现 {len(result.pii_entities)} 个PII实体")
+        logger.info("图像脱敏完成: 发现 {} 个PII实体", pii_count)
 
-        return StreamingResponse(
-            output_buffer,
+        return Response(
+            content=output_buffer.getvalue(),
             media_type="image/png",
             headers={
-                "X-PII-Count": str(len(result.pii_entities)),
+                "X-PII-Count": str(pii_count),
                 "Content-Disposition": f"attachment; filename=redacted_{image.filename or 'image.png'}",
             },
         )
 
     except UnsupportedImageFormatError as e:
-        logger.error(f"图像格式错误: {e}")
+        logger.error("图像格式错误: {}", e)
         raise HTTPException(status_code=400, detail=str(e)) from None
     except OCRError as e:
-        logger.error(f"OCR错误: {e}")
+        logger.error("OCR错误: {}", e)
         raise HTTPException(status_code=500, detail=f"OCR识别失败: {e}") from None
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"图像处理异常: {e}")
+        logger.error("图像处理异常: {}", e)
         raise HTTPException(status_code=500, detail=f"图像处理失败: {e}") from None
 
 
@@ -221,6 +314,7 @@ async def anonymize_image(
 )
 async def analyze_image(
     image: Annotated[UploadFile, File(..., description="要分析的图像文件")],
+    processor: Annotated[ImageProcessor, Depends(get_image_processor)],
     entities: Annotated[
         str | None,
         Form(description="要识别的PII类型，JSON数组格式"),
@@ -239,6 +333,7 @@ async def analyze_image(
 
     Args:
         image: 上传的图像文件
+        processor: 图像处理器
         entities: 要识别的PII类型列表
         allow_list: 白名单列表
         score_threshold: 置信度阈值，None时使用配置文件中的按类型阈值
@@ -246,61 +341,50 @@ async def analyze_image(
     Returns:
         PII分析结果
     """
-    import json
-
-    logger.info(f"收到图像分析请求: filename={image.filename}")
+    logger.info("收到图像分析请求: filename={}", image.filename)
 
     validate_image_file(image)
 
     try:
-        image_bytes = await image.read()
-
-        if len(image_bytes) > settings.max_image_size:
-            raise HTTPException(
-                status_code=400,
-                detail="图像大小超出限制",
-            )
-
-        pil_image = Image.open(BytesIO(image_bytes))
+        pil_image = open_upload_image(image)
 
         entities_list: list[str] | None = None
         if entities:
             try:
-                entities_list = json.loads(entities)
+                entities_list = json_loads(entities)
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="entities格式错误") from None
 
         allow_list_data: list[str] | None = None
         if allow_list:
             try:
-                allow_list_data = json.loads(allow_list)
+                allow_list_data = json_loads(allow_list)
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="allow_list格式错误") from None
 
-        processor = get_image_processor()
-        pii_entities = processor.analyze_only(
-            image=pil_image,
-            entities=entities_list,
-            allow_list=allow_list_data,
-            score_threshold=score_threshold,
-        )
-
-        entity_responses = [
-            ImagePIIEntityResponse(
-                entity_type=entity.entity_type,
-                text=entity.text,
-                bbox={
-                    "left": entity.bbox[0],
-                    "top": entity.bbox[1],
-                    "width": entity.bbox[2],
-                    "height": entity.bbox[3],
-                },
-                score=entity.score,
+        def analyze() -> tuple[list[ImagePIIEntity], OCRResult | None]:
+            # OCR结果取自引擎最近一次识别，需与分析在同一次引擎调用中读取
+            entities_found = processor.analyze_only(
+                image=pil_image,
+                entities=entities_list,
+                allow_list=allow_list_data,
+                score_threshold=score_threshold,
             )
-            for entity in pii_entities
-        ]
-
-        ocr_result = processor._redactor.get_ocr_result()
+            return entities_found, processor._redactor.get_ocr_result()
+
+        pii_entities, ocr_result = await run_in_engine_thread(analyze)
+
+        entity_responses = _IMAGE_ENTITY_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "entity_type": entity.entity_type,
+                    "text": entity.text,
+                    "bbox": entity.bbox,
+                    "score": entity.score,
+                }
+                for entity in pii_entities
+            ]
+        )
 
         data = ImageAnalyzeData(
             pii_entities=entity_responses,
@@ -308,24 +392,24 @@ async def analyze_image(
             has_pii=len(pii_entities) > 0,
         )
 
-        logger.info(f"图像分析完成: 发现 {len(pii_entities)} 个PII实体")
+        logger.info("图像分析完成: 发现 {} 个PII实体", len(pii_entities))
 
         return APIResponse(
             code=200,
             message="success",
-            data=data.model_dump(),
+            data=data,
         )
 
     except UnsupportedImageFormatError as e:
-        logger.error(f"图像格式错误: {e}")
+        logger.error("图像格式错误: {}", e)
         raise HTTPException(status_code=400, detail=str(e)) from None
     except OCRError as e:
-        logger.error(f"OCR错误: {e}")
+        logger.error("OCR错误: {}", e)
         raise HTTPException(status_code=500, detail=f"OCR识别失败: {e}") from None
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"图像分析异常: {e}")
+        logger.error("图像分析异常: {}", e)
         raise HTTPException(status_code=500, detail=f"图像分析失败: {e}") from None
 
 
@@ -341,20 +425,4 @@ async def get_mosaic_styles() -> APIResponse:
     Returns:
         马赛克样式列表
     """
-    styles = [
-        {
-            "name": style.value,
-            "description": {
-                "pixel": "像素块马赛克 - 将区域划分为像素块并取平均色",
-                "blur": "高斯模糊 - 对区域应用高斯模糊效果",
-                "fill": "纯色填充 - 用指定颜色覆盖区域",
-            }.get(style.value, ""),
-        }
-        for style in MosaicStyle
-    ]
-
-    return APIResponse(
-        code=200,
-        message="success",
-        data={"styles": styles},
-    )
+    return APIResponse(code=200, message="success", data=_MOSAIC_STYLES_DATA)
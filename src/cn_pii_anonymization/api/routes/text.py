@@ -4,9 +4,13 @@
 提供文本PII识别和匿名化的API端点。
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 from presidio_anonymizer.entities import OperatorConfig
+from pydantic import TypeAdapter
 
+from cn_pii_anonymization.api.executor import run_in_engine_thread
 from cn_pii_anonymization.api.schemas import (
     APIResponse,
     OperatorConfigRequest,
@@ -16,7 +20,7 @@ from cn_pii_anonymization.api.schemas import (
     TextAnonymizeData,
     TextAnonymizeRequest,
 )
-from cn_pii_anonymization.operators import CNMaskOperator
+from cn_pii_anonymization.core.anonymizer import _fake_operator_config, _mask_operator_config
 from cn_pii_anonymization.processors.text_processor import TextProcessor
 from cn_pii_anonymization.utils.exceptions import CNPIIError
 from cn_pii_anonymization.utils.logger import get_logger
@@ -25,15 +29,28 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/text", tags=["文本处理"])
 
-_text_processor: TextProcessor | None = None
+# 实体列表整体交给pydantic-core校验，比逐个构造模型实例更快
+_ENTITY_LIST_ADAPTER = TypeAdapter(list[PIIEntityResponse])
+
+
+def get_text_processor(request: Request) -> TextProcessor:
+    """
+    获取文本处理器
+
+    处理器在应用启动时创建并保存在app.state上；未经过lifespan启动时
+    （如未使用上下文管理器的TestClient）在首次请求时创建。
 
+    Args:
+        request: 当前请求
 
-def get_text_processor() -> TextProcessor:
-    """获取文本处理器单例"""
-    global _text_processor
-    if _text_processor is None:
-        _text_processor = TextProcessor()
-    return _text_processor
+    Returns:
+        文本处理器实例
+    """
+    state = request.app.state
+    processor = getattr(state, "text_processor", None)
+    if processor is None:
+        processor = state.text_processor = TextProcessor()
+    return processor
 
 
 def build_operator_config(
@@ -54,25 +71,16 @@ def build_operator_config(
     config: dict[str, OperatorConfig] = {}
     for entity_type, op_config in operators.items():
         op_type = op_config.type
-        params = {
-            "masking_char": op_config.masking_char,
-            "keep_prefix": op_config.keep_prefix,
-            "keep_suffix": op_config.keep_suffix,
-            "mask_email_domain": op_config.mask_email_domain,
-        }
 
         if op_type == "mask":
-            config[entity_type] = OperatorConfig(
-                "custom",
-                {"lambda": lambda x, p=params: CNMaskOperator().operate(x, p)},
+            config[entity_type] = _mask_operator_config(
+                op_config.masking_char,
+                op_config.keep_prefix,
+                op_config.keep_suffix,
+                op_config.mask_email_domain,
             )
         elif op_type == "fake":
-            from cn_pii_anonymization.operators import CNFakeOperator
-
-            config[entity_type] = OperatorConfig(
-                "custom",
-                {"lambda": lambda x, et=entity_type: CNFakeOperator().operate(x, {"entity_type": et})},
-            )
+            config[entity_type] = _fake_operator_config(entity_type)
 
     return config
 
@@ -83,7 +91,10 @@ def build_operator_config(
     summary="文本匿名化",
     description="识别文本中的PII并进行匿名化处理",
 )
-async def anonymize_text(request: TextAnonymizeRequest) -> APIResponse:
+async def anonymize_text(
+    request: TextAnonymizeRequest,
+    processor: Annotated[TextProcessor, Depends(get_text_processor)],
+) -> APIResponse:
     """
     文本匿名化接口
 
@@ -91,17 +102,18 @@ async def anonymize_text(request: TextAnonymizeRequest) -> APIResponse:
 
     Args:
         request: 匿名化请求
+        processor: 文本处理器
 
     Returns:
         APIResponse: 包含匿名化结果的响应
     """
     try:
-        logger.info(f"收到文本匿名化请求，文本长度: {len(request.text)}")
+        logger.info("收到文本匿名化请求，文本长度: {}", len(request.text))
 
-        processor = get_text_processor()
         operator_config = build_operator_config(request.operators)
 
-        result = processor.process(
+        result = await run_in_engine_thread(
+            processor.process,
             text=request.text,
             entities=request.entities,
             operator_config=operator_config,
@@ -109,17 +121,19 @@ async def anonymize_text(request: TextAnonymizeRequest) -> APIResponse:
             score_threshold=request.score_threshold,
         )
 
-        pii_entities = [
-            PIIEntityResponse(
-                entity_type=e.entity_type,
-                start=e.start,
-                end=e.end,
-                score=e.score,
-                original_text=e.original_text,
-                anonymized_text=e.anonymized_text,
-            )
-            for e in result.pii_entities
-        ]
+        pii_entities = _ENTITY_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "entity_type": e.entity_type,
+                    "start": e.start,
+                    "end": e.end,
+                    "score": e.score,
+                    "original_text": e.original_text,
+                    "anonymized_text": e.anonymized_text,
+                }
+                for e in result.pii_entities
+            ]
+        )
 
         data = TextAnonymizeData(
             original_text=result.original_text,
@@ -127,15 +141,15 @@ async def anonymize_text(request: TextAnonymizeRequest) -> APIResponse:
             pii_entities=pii_entities,
         )
 
-        logger.info(f"匿名化完成，发现 {len(pii_entities)} 个PII实体")
+        logger.info("匿名化完成，发现 {} 个PII实体", len(pii_entities))
 
         return APIResponse(code=200, message="success", data=data)
 
     except CNPIIError as e:
-        logger.error(f"PII处理错误: {e.message}")
+        logger.error("PII处理错误: {}", e.message)
         raise HTTPException(status_code=400, detail=e.message) from None
     except Exception as e:
-        logger.exception(f"处理请求时发生未知错误: {e}")
+        logger.exception("处理请求时发生未知错误: {}", e)
         raise HTTPException(status_code=500, detail=str(e)) from None
 
 
@@ -145,7 +159,10 @@ async def anonymize_text(request: TextAnonymizeRequest) -> APIResponse:
     summary="文本分析",
     description="仅分析文本中的PII，不进行匿名化",
 )
-async def analyze_text(request: TextAnonymizeRequest) -> APIResponse:
+async def analyze_text(
+    request: TextAnonymizeRequest,
+    processor: Annotated[TextProcessor, Depends(get_text_processor)],
+) -> APIResponse:
     """
     文本分析接口
 
@@ -153,47 +170,50 @@ async def analyze_text(request: TextAnonymizeRequest) -> APIResponse:
 
     Args:
         request: 分析请求
+        processor: 文本处理器
 
     Returns:
         APIResponse: 包含分析结果的响应
     """
     try:
-        logger.info(f"收到文本分析请求，文本长度: {len(request.text)}")
+        logger.info("收到文本分析请求，文本长度: {}", len(request.text))
 
-        processor = get_text_processor()
-        entities = processor.analyze_only(
+        entities = await run_in_engine_thread(
+            processor.analyze_only,
             text=request.text,
             entities=request.entities,
             language=request.language,
             score_threshold=request.score_threshold,
         )
 
-        pii_entities = [
-            PIIEntityResponse(
-                entity_type=e.entity_type,
-                start=e.start,
-                end=e.end,
-                score=e.score,
-                original_text=e.original_text,
-                anonymized_text="",
-            )
-            for e in entities
-        ]
+        pii_entities = _ENTITY_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "entity_type": e.entity_type,
+                    "start": e.start,
+                    "end": e.end,
+                    "score": e.score,
+                    "original_text": e.original_text,
+                    "anonymized_text": "",
+                }
+                for e in entities
+            ]
+        )
 
         data = TextAnalyzeData(
             pii_entities=pii_entities,
             has_pii=len(entities) > 0,
         )
 
-        logger.info(f"分析完成，发现 {len(pii_entities)} 个PII实体")
+        logger.info("分析完成，发现 {} 个PII实体", len(pii_entities))
 
         return APIResponse(code=200, message="success", data=data)
 
     except CNPIIError as e:
-        logger.error(f"PII处理错误: {e.message}")
+        logger.error("PII处理错误: {}", e.message)
         raise HTTPException(status_code=400, detail=e.message) from None
     except Exception as e:
-        logger.exception(f"处理请求时发生未知错误: {e}")
+        logger.exception("处理请求时发生未知错误: {}", e)
         raise HTTPException(status_code=500, detail=str(e)) from None
 
 
@@ -203,21 +223,26 @@ async def analyze_text(request: TextAnonymizeRequest) -> APIResponse:
     summary="获取支持的实体类型",
     description="返回系统支持的所有PII实体类型",
 )
-async def get_supported_entities() -> APIResponse:
+async def get_supported_entities(
+    processor: Annotated[TextProcessor, Depends(get_text_processor)],
+) -> APIResponse:
     """
     获取支持的PII实体类型
 
+    Args:
+        processor: 文本处理器
+
     Returns:
         APIResponse: 包含支持的实体类型列表
     """
     try:
-        processor = get_text_processor()
-        entities = processor.get_supported_entities()
+        # 首次调用可能触发分析器的延迟初始化，放到引擎线程执行，避免阻塞事件循环
+        entities = await run_in_engine_thread(processor.get_supported_entities)
 
         data = SupportedEntitiesData(entities=entities)
 
         return APIResponse(code=200, message="success", data=data)
 
     except Exception as e:
-        logger.exception(f"获取实体类型时发生错误: {e}")
+        logger.exception("获取实体类型时发生错误: {}", e)
         raise HTTPException(status_code=500, detail=str(e)) from None
@@ -6,7 +6,7 @@ API响应模型
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 
 class PIIEntityResponse(BaseModel):
@@ -154,15 +154,52 @@ class ImagePIIEntityResponse(BaseModel):
     Attributes:
         entity_type: 实体类型
         text: 识别出的文本
-        bbox: 边界框信息
+        bbox: 边界框 (left, top, width, height)
         score: 置信度分数
     """
 
     entity_type: str = Field(..., description="实体类型")
     text: str = Field(..., description="识别出的文本")
-    bbox: dict[str, int] = Field(..., description="边界框信息")
+    bbox: tuple[int, int, int, int] = Field(..., description="边界框 (left, top, width, height)")
     score: float = Field(..., ge=0.0, le=1.0, description="置信度分数")
 
+    @field_validator("bbox", mode="before")
+    @classmethod
+    def validate_bbox(cls, bbox: Any) -> Any:
+        """
+        校验边界框
+
+        同时接受元组和API文档中的 {left, top, width, height} 对象形式。
+
+        Args:
+            bbox: 边界框元组或字典
+
+        Returns:
+            边界框元组，其他输入原样交给后续校验
+        """
+        if isinstance(bbox, dict):
+            try:
+                return (bbox["left"], bbox["top"], bbox["width"], bbox["height"])
+            except KeyError as e:
+                raise ValueError(f"边界框缺少字段: {e.args[0]}") from None
+        return bbox
+
+    @field_serializer("bbox")
+    def serialize_bbox(self, bbox: tuple[int, int, int, int]) -> dict[str, int]:
+        """
+        序列化边界框
+
+        内部以元组保存边界框，仅在输出响应时转换为对象，保持API格式不变。
+
+        Args:
+            bbox: 边界框元组
+
+        Returns:
+            包含left/top/width/height的边界框字典
+        """
+        left, top, width, height = bbox
+        return {"left": left, "top": top, "width": width, "height": height}
+
 
 class ImageAnonymizeData(BaseModel):
     """
@@ -1,8 +1,9 @@
 """配置模块"""
 
-from cn_pii_anonymization.config.settings import Settings, settings
+from cn_pii_anonymization.config.settings import Settings, get_settings, settings
 
 __all__ = [
     "Settings",
+    "get_settings",
     "settings",
 ]
@@ -6,12 +6,24 @@
 支持PII识别器优先级机制，当多个识别结果重叠时，保留高优先级的结果。
 """
 
-from typing import Any
+import copy
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar
 
 from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
 from presidio_analyzer.recognizer_result import RecognizerResult
 
-from cn_pii_anonymization.config.settings import settings
+from cn_pii_anonymization.config.settings import (
+    PIIPrioritySettings,
+    ScoreThresholdSettings,
+    settings,
+)
+from cn_pii_anonymization.nlp.ie_cache import IEResultDiskCache
 from cn_pii_anonymization.nlp.ie_engine import PaddleNLPInfoExtractionEngine
 from cn_pii_anonymization.nlp.nlp_engine import PaddleNlpEngineProvider
 from cn_pii_anonymization.recognizers import (
@@ -22,12 +34,33 @@ from cn_pii_anonymization.recognizers import (
     CNNameRecognizer,
     CNPassportRecognizer,
     CNPhoneRecognizer,
+    CNPIIRecognizer,
 )
 from cn_pii_anonymization.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _regex_recognizers() -> tuple[CNPIIRecognizer, ...]:
+    """
+    获取正则类识别器实例
+
+    正则类识别器不依赖IE引擎且创建后无可变状态，每个进程只创建一次，
+    分析器重置（如测试中调用reset）后重新构建注册表时直接复用。
+
+    Returns:
+        正则类识别器元组
+    """
+    return (
+        CNPhoneRecognizer(),
+        CNIDCardRecognizer(),
+        CNBankCardRecognizer(),
+        CNPassportRecognizer(),
+        CNEmailRecognizer(),
+    )
+
+
 class CNPIIAnalyzerEngine:
     """
     中文PII分析器引擎
@@ -40,6 +73,9 @@ class CNPIIAnalyzerEngine:
         _registry: 识别器注册表
         _nlp_engine: PaddleNLP引擎（分词与词性标注）
         _ie_engine: PaddleNLP信息抽取引擎（姓名和地址识别）
+        _ie_recognizers: 使用IE结果缓存的识别器列表
+        _name_recognizer: 姓名识别器
+        _result_cache: 单文本分析结果的LRU缓存
 
     Example:
         >>> engine = CNPIIAnalyzerEngine()
@@ -48,27 +84,140 @@ class CNPIIAnalyzerEngine:
         ...     print(f"发现{r.entity_type}: {r.score}")
     """
 
+    # 注册表与分析器共用的语言列表（Presidio会比较两者是否一致）
+    _SUPPORTED_LANGUAGES: ClassVar[tuple[str, ...]] = ("zh",)
+
+    # 正则类识别器对应的实体类型，它们的匹配都要求文本中含有数字或"@"
+    REGEX_ENTITIES: ClassVar[frozenset[str]] = frozenset(
+        {"CN_PHONE_NUMBER", "CN_ID_CARD", "CN_BANK_CARD", "CN_PASSPORT", "CN_EMAIL"}
+    )
+    _REGEX_CANDIDATE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[\d@]")
+    _NON_DIGIT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\D+")
+    # 各数字类正则实体匹配所需的最少数字个数（身份证18位、银行卡16位、手机号11位、护照6位）
+    _REGEX_ENTITY_MIN_DIGITS: ClassVar[tuple[tuple[str, int], ...]] = (
+        ("CN_ID_CARD", 18),
+        ("CN_BANK_CARD", 16),
+        ("CN_PHONE_NUMBER", 11),
+        ("CN_PASSPORT", 6),
+    )
+
+    # 标签类文本（不需要IE识别）
+    _IE_LABEL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(
+            [
+                r"^身份证号",
+                r"^联系方式",
+                r"^手机号码",
+                r"^电子邮箱",
+                r"^家庭住址",
+                r"^护照号码",
+                r"^钱包与支付",
+                r"^储蓄卡",
+                r"^已通过实名认证",
+                r"^银行卡",
+                r"^信用卡",
+                r"^借记卡",
+                r"^开户行",
+                r"^持卡人",
+                r"^有效期",
+                r"^安全码",
+                r"^CVV",
+                r"^银行",
+                r"^中国银行",
+                r"^工商银行",
+                r"^建设银行",
+                r"^农业银行",
+                r"^招商银行",
+                r"^BANK",
+                r"^OF",
+                r"^CHINA",
+            ]
+        ),
+        re.IGNORECASE,
+    )
+    # 纯数字/字母/特殊字符的正则
+    _IE_PURE_NUMBER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^[\d\s\-+\.]+$")
+    _IE_PURE_ALPHA_NUM_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^[a-zA-Z0-9\s\-_\.@]+$")
+
     _instance: "CNPIIAnalyzerEngine | None" = None
     _initialized: bool = False
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # 单例实例属性固定，使用槽位存储，不创建实例__dict__
+    __slots__ = (
+        "_ready",
+        "_ready_lock",
+        "_result_cache",
+        "_result_cache_lock",
+        "_result_cache_size",
+        "_thresholds",
+        "_priorities",
+        "_batch_pool",
+        "_batch_pool_lock",
+        "_nlp_engine",
+        "_ie_engine",
+        "_registry",
+        "_name_recognizer",
+        "_ie_recognizers",
+        "_custom_entities",
+        "_analyzer",
+        "_analyze",
+    )
 
     def __new__(cls) -> "CNPIIAnalyzerEngine":
-        """单例模式，确保全局只有一个分析器实例"""
+        """单例模式，确保全局只有一个分析器实例（多线程下只创建一次）"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
-        """初始化分析器引擎"""
+        """
+        初始化分析器引擎
+
+        NLP引擎、识别器注册表和Presidio分析器延迟到首次使用时创建，
+        仅导入或构造引擎（如查看CLI帮助、API文档）时不承担初始化开销。
+        """
         if CNPIIAnalyzerEngine._initialized:
             return
 
-        logger.info("初始化中文PII分析器引擎...")
-        self._setup_nlp_engine()
-        self._setup_ie_engine()
-        self._setup_registry()
-        self._setup_analyzer()
-        CNPIIAnalyzerEngine._initialized = True
-        logger.info("中文PII分析器引擎初始化完成")
+        with CNPIIAnalyzerEngine._instance_lock:
+            if CNPIIAnalyzerEngine._initialized:
+                return
+
+            self._ready = False
+            self._ready_lock = threading.Lock()
+            # 单文本分析结果的LRU缓存
+            self._result_cache: OrderedDict[tuple, list[RecognizerResult]] = OrderedDict()
+            self._result_cache_lock = threading.Lock()
+            self._result_cache_size = settings.analyze_cache_size
+            # 热路径使用的派生配置，配置变更后通过refresh_settings()重新绑定
+            self._thresholds = settings.score_thresholds
+            self._priorities = settings.pii_priorities
+            # 批量分析的线程池，仅在配置了多个工作线程时按需创建
+            self._batch_pool: ThreadPoolExecutor | None = None
+            self._batch_pool_lock = threading.Lock()
+            # 自定义识别器支持的实体类型，这些类型不参与正则类实体预过滤
+            self._custom_entities: frozenset[str] = frozenset()
+            CNPIIAnalyzerEngine._initialized = True
+
+    def _ensure_ready(self) -> None:
+        """确保引擎组件已创建，首次调用时在锁内完成初始化"""
+        if self._ready:
+            return
+
+        with self._ready_lock:
+            if self._ready:
+                return
+
+            logger.info("初始化中文PII分析器引擎...")
+            self._setup_nlp_engine()
+            self._setup_ie_engine()
+            self._setup_registry()
+            self._setup_analyzer()
+            self._ready = True
+            logger.info("中文PII分析器引擎初始化完成")
 
     def _setup_nlp_engine(self) -> None:
         """设置NLP引擎（使用PaddleNLP LAC，用于分词和词性标注）"""
@@ -80,54 +229,52 @@ class CNPIIAnalyzerEngine:
         }
         provider = PaddleNlpEngineProvider(nlp_configuration=nlp_configuration)
         self._nlp_engine = provider.create_engine()
-        logger.debug(f"NLP引擎已加载: PaddleNLP LAC ({settings.nlp_model})")
+        logger.debug("NLP引擎已加载: PaddleNLP LAC ({})", settings.nlp_model)
 
     def _setup_ie_engine(self) -> None:
         """设置信息抽取引擎（用于姓名和地址识别）"""
+        cache = None
+        if settings.ie_cache_dir:
+            cache = IEResultDiskCache(Path(settings.ie_cache_dir) / "ie_cache.sqlite3")
         self._ie_engine = PaddleNLPInfoExtractionEngine(
             schema=["地址", "具体地址", "姓名", "人名"],
             use_gpu=False,
+            cache=cache,
         )
         logger.debug("信息抽取引擎已创建: schema=['地址', '具体地址', '姓名', '人名']")
 
     def _setup_registry(self) -> None:
         """设置识别器注册表并注册中文PII识别器"""
-        self._registry = RecognizerRegistry(supported_languages=["zh"])
-
-        # 正则表达式识别器（不需要IE引擎）
-        regex_recognizers = [
-            CNPhoneRecognizer(),
-            CNIDCardRecognizer(),
-            CNBankCardRecognizer(),
-            CNPassportRecognizer(),
-            CNEmailRecognizer(),
-        ]
+        self._registry = RecognizerRegistry(supported_languages=list(self._SUPPORTED_LANGUAGES))
 
-        for recognizer in regex_recognizers:
+        # 正则表达式识别器（不需要IE引擎，进程内共享）
+        for recognizer in _regex_recognizers():
             self._registry.add_recognizer(recognizer)
-            logger.debug(f"已注册识别器: {recognizer.supported_entities}")
+            logger.debug("已注册识别器: {}", recognizer.supported_entities)
 
-        # 信息抽取识别器（需要IE引擎）
-        ie_recognizers = [
+        # 信息抽取识别器（需要IE引擎），保留直接引用，批量分析和姓名列表更新时无需扫描注册表
+        self._name_recognizer = CNNameRecognizer(
+            ie_engine=self._ie_engine,
+            allow_list=settings.name_allow_set,
+            deny_list=settings.name_deny_set,
+        )
+        self._ie_recognizers: list[Any] = [
             CNAddressRecognizer(ie_engine=self._ie_engine),
-            CNNameRecognizer(
-                ie_engine=self._ie_engine,
-                allow_list=settings.parsed_name_allow_list,
-                deny_list=settings.parsed_name_deny_list,
-            ),
+            self._name_recognizer,
         ]
 
-        for recognizer in ie_recognizers:
+        for recognizer in self._ie_recognizers:
             self._registry.add_recognizer(recognizer)
-            logger.debug(f"已注册识别器(IE): {recognizer.supported_entities}")
+            logger.debug("已注册识别器(IE): {}", recognizer.supported_entities)
 
     def _setup_analyzer(self) -> None:
         """设置分析器"""
         self._analyzer = AnalyzerEngine(
             registry=self._registry,
-            supported_languages=["zh"],
+            supported_languages=list(self._SUPPORTED_LANGUAGES),
             nlp_engine=self._nlp_engine,
         )
+        self._analyze = self._analyzer.analyze
 
     def analyze(
         self,
@@ -141,6 +288,8 @@ class CNPIIAnalyzerEngine:
         """
         分析文本中的PII实体
 
+        相同参数的重复文本直接返回缓存结果的副本，缓存容量由analyze_cache_size配置。
+
         Args:
             text: 待分析的文本
             language: 语言代码，默认为"zh"
@@ -159,34 +308,48 @@ class CNPIIAnalyzerEngine:
             ...     entities=["CN_PHONE_NUMBER", "CN_ID_CARD"]
             ... )
         """
-        logger.debug(f"开始分析文本，长度: {len(text)}")
+        logger.debug("开始分析文本，长度: {}", len(text))
 
-        nlp_artifacts = self._nlp_engine.process_text(text, language)
+        cache_scope = self._result_cache_scope(
+            language, entities, score_threshold, allow_list, kwargs
+        )
+        cache_key = None if cache_scope is None else (text, cache_scope)
+        if cache_key is not None:
+            cached_results = self._get_cached_results(cache_key)
+            if cached_results is not None:
+                logger.debug("命中分析结果缓存，发现 {} 个PII实体", len(cached_results))
+                return cached_results
 
-        threshold_settings = settings.score_thresholds
-        min_threshold = threshold_settings.default
+        self._ensure_ready()
 
-        results = self._analyzer.analyze(
-            text=text,
-            language=language,
-            entities=entities,
-            score_threshold=min_threshold,
-            allow_list=allow_list,
-            nlp_artifacts=nlp_artifacts,
-            **kwargs,
+        unmatchable = self._skippable_regex_entities(text)
+        if unmatchable:
+            entities = self._without_regex_entities(entities, language, unmatchable)
+            if not entities:
+                return []
+
+        nlp_artifacts = self._nlp_engine.process_text(text, language)
+
+        results = self._run_presidio(
+            text,
+            language,
+            entities,
+            self._presidio_threshold(score_threshold, self._thresholds),
+            allow_list,
+            nlp_artifacts,
+            kwargs,
         )
 
-        if score_threshold is not None:
-            filtered_results = [r for r in results if r.score >= score_threshold]
-        else:
-            filtered_results = [
-                r for r in results if r.score >= threshold_settings.get_threshold(r.entity_type)
-            ]
+        # 按类型阈值过滤并应用优先级过滤：当结果重叠时，保留高优先级的结果
+        # 指定了全局阈值时Presidio已完成过滤，无需再按类型比较
+        filtered_results = self._apply_priority_filter(
+            results, self._thresholds if score_threshold is None else None
+        )
 
-        # 应用优先级过滤：当结果重叠时，保留高优先级的结果
-        filtered_results = self._apply_priority_filter(filtered_results)
+        if cache_key is not None:
+            self._store_cached_results(cache_key, filtered_results)
 
-        logger.debug(f"分析完成，发现 {len(filtered_results)} 个PII实体")
+        logger.debug("分析完成，发现 {} 个PII实体", len(filtered_results))
         return filtered_results
 
     def analyze_batch(
@@ -204,7 +367,9 @@ class CNPIIAnalyzerEngine:
         相比逐个调用analyze，批量处理会：
         1. 预先批量调用IE引擎处理所有文本
         2. 将IE结果缓存供识别器使用
-        3. 减少模型加载和初始化开销
+        3. 一次LAC调用完成所有文本的分词
+        4. 重复文本只分析一次，与analyze共用分析结果缓存
+        5. 配置了ANALYZE_BATCH_WORKERS时多线程识别各文本
 
         Args:
             texts: 待分析的文本列表
@@ -225,124 +390,414 @@ class CNPIIAnalyzerEngine:
         if not texts:
             return {}
 
-        logger.debug(f"开始批量分析 {len(texts)} 个文本")
+        logger.debug("开始批量分析 {} 个文本", len(texts))
 
-        # 预先批量调用IE引擎，缓存结果
-        self._precompute_ie_results(texts)
+        self._ensure_ready()
 
-        threshold_settings = settings.score_thresholds
-        min_threshold = threshold_settings.default
+        presidio_threshold = self._presidio_threshold(score_threshold, self._thresholds)
+        type_thresholds = self._thresholds if score_threshold is None else None
 
         results_map: dict[str, list] = {}
 
+        # 确定每个去重文本需要识别的实体类型，命中结果缓存或无需识别的文本不再分析
+        pending: dict[str, list[str] | None] = {}
+        cache_keys: dict[str, tuple] = {}
+        cache_scope = self._result_cache_scope(
+            language, entities, score_threshold, allow_list, kwargs
+        )
         for text in texts:
+            if text in results_map:
+                continue
+            results_map[text] = []
             if not text:
-                results_map[text] = []
                 continue
 
-            nlp_artifacts = self._nlp_engine.process_text(text, language)
+            if cache_scope is not None:
+                cache_key = (text, cache_scope)
+                cached_results = self._get_cached_results(cache_key)
+                if cached_results is not None:
+                    results_map[text] = cached_results
+                    continue
+                cache_keys[text] = cache_key
 
-            results = self._analyzer.analyze(
-                text=text,
-                language=language,
-                entities=entities,
-                score_threshold=min_threshold,
-                allow_list=allow_list,
-                nlp_artifacts=nlp_artifacts,
-                **kwargs,
-            )
+            text_entities = entities
+            unmatchable = self._skippable_regex_entities(text)
+            if unmatchable:
+                text_entities = self._without_regex_entities(entities, language, unmatchable)
+                if not text_entities:
+                    continue
 
-            if score_threshold is not None:
-                filtered_results = [r for r in results if r.score >= score_threshold]
-            else:
-                filtered_results = [
-                    r for r in results if r.score >= threshold_settings.get_threshold(r.entity_type)
-                ]
+            pending[text] = text_entities
+
+        if not pending:
+            logger.debug("批量分析完成，全部文本命中缓存或无需分析")
+            return results_map
+
+        # 预先批量调用IE引擎，缓存结果
+        self._precompute_ie_results(list(pending))
+
+        # 一次调用完成所有待分析文本的分词
+        nlp_artifacts_map = dict(self._nlp_engine.process_batch(pending, language))
+
+        def analyze_one(text: str) -> list[RecognizerResult]:
+            results = self._run_presidio(
+                text,
+                language,
+                pending[text],
+                presidio_threshold,
+                allow_list,
+                nlp_artifacts_map[text],
+                kwargs,
+            )
 
-            # 应用优先级过滤：当结果重叠时，保留高优先级的结果
-            filtered_results = self._apply_priority_filter(filtered_results)
+            # 按类型阈值过滤并应用优先级过滤：当结果重叠时，保留高优先级的结果
+            return self._apply_priority_filter(results, type_thresholds)
 
+        # IE结果与分词均已预先计算，识别阶段只读共享状态，各文本可并行处理
+        pool = self._get_batch_pool() if len(pending) > 1 else None
+        outputs = pool.map(analyze_one, pending) if pool else map(analyze_one, pending)
+        for text, filtered_results in zip(pending, outputs, strict=True):
             results_map[text] = filtered_results
+            stored_key = cache_keys.get(text)
+            if stored_key is not None:
+                self._store_cached_results(stored_key, filtered_results)
 
-        logger.debug("批量分析完成")
+        logger.debug("批量分析完成，分析 {} 个文本", len(pending))
         return results_map
 
-    def _apply_priority_filter(self, results: list[RecognizerResult]) -> list[RecognizerResult]:
+    def _get_batch_pool(self) -> ThreadPoolExecutor | None:
+        """
+        获取批量分析线程池
+
+        CPython的re在持有GIL的情况下执行匹配，默认单线程即可；
+        在无GIL的Python构建上可通过ANALYZE_BATCH_WORKERS开启多线程。
+
+        Returns:
+            线程池，配置为单线程时返回None
+        """
+        workers = settings.analyze_batch_workers
+        if workers <= 1:
+            return None
+
+        if self._batch_pool is None:
+            with self._batch_pool_lock:
+                if self._batch_pool is None:
+                    self._batch_pool = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="cn-pii-analyze"
+                    )
+                    logger.debug("批量分析线程池已创建: workers={}", workers)
+        return self._batch_pool
+
+    def _result_cache_scope(
+        self,
+        language: str,
+        entities: list[str] | None,
+        score_threshold: float | None,
+        allow_list: list[str] | None,
+        kwargs: dict[str, Any],
+    ) -> tuple | None:
+        """
+        构建分析结果缓存键中与文本无关的部分
+
+        同一次调用的所有文本共用该部分，缓存键为 (text, scope)。
+        缓存关闭或传入了额外的Presidio参数时不缓存，返回None。
+
+        Args:
+            language: 语言代码
+            entities: 要识别的PII类型列表
+            score_threshold: 全局置信度阈值
+            allow_list: 白名单列表
+            kwargs: 其他参数
+
+        Returns:
+            缓存键的公共部分，不缓存时返回None
+        """
+        if not self._result_cache_size or kwargs:
+            return None
+        return (
+            language,
+            None if entities is None else tuple(entities),
+            score_threshold,
+            None if allow_list is None else tuple(allow_list),
+        )
+
+    def _get_cached_results(self, key: tuple) -> list[RecognizerResult] | None:
         """
-        应用优先级过滤
+        读取缓存的分析结果
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            识别结果的副本，未命中时返回None
+        """
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(key)
+        return [copy.copy(r) for r in cached]
+
+    def _store_cached_results(self, key: tuple, results: list[RecognizerResult]) -> None:
+        """
+        缓存分析结果，超出容量时淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            results: 识别结果列表（缓存其副本，调用方修改结果不影响缓存）
+        """
+        cached = [copy.copy(r) for r in results]
+        with self._result_cache_lock:
+            self._result_cache[key] = cached
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """
+        清空分析结果缓存
+
+        识别器、姓名列表或阈值配置变化后调用，避免返回过期结果。
+        """
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def refresh_settings(self) -> None:
+        """
+        重新绑定阈值和优先级配置
+
+        修改配置并调用settings.refresh()后调用，同时清空分析结果缓存。
+
+        Example:
+            >>> settings.score_threshold_name = 0.5
+            >>> settings.refresh()
+            >>> CNPIIAnalyzerEngine().refresh_settings()
+        """
+        self._thresholds = settings.score_thresholds
+        self._priorities = settings.pii_priorities
+        self.clear_cache()
+        logger.info("分析器阈值与优先级配置已重新加载")
+
+    def _run_presidio(
+        self,
+        text: str,
+        language: str,
+        entities: list[str] | None,
+        score_threshold: float,
+        allow_list: list[str] | None,
+        nlp_artifacts: Any,
+        kwargs: dict[str, Any],
+    ) -> list[RecognizerResult]:
+        """
+        调用Presidio分析器（预先绑定的analyze）
+
+        Args:
+            text: 待分析的文本
+            language: 语言代码
+            entities: 要识别的PII类型列表，None表示识别所有类型
+            score_threshold: 传给Presidio的置信度阈值
+            allow_list: 白名单列表
+            nlp_artifacts: 预先计算的NLP结果
+            kwargs: 其他参数传递给Presidio分析器
+
+        Returns:
+            Presidio识别结果列表
+        """
+        return self._analyze(
+            text=text,
+            language=language,
+            entities=entities,
+            score_threshold=score_threshold,
+            allow_list=allow_list,
+            nlp_artifacts=nlp_artifacts,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _presidio_threshold(
+        score_threshold: float | None,
+        thresholds: ScoreThresholdSettings | None = None,
+    ) -> float:
+        """
+        计算传给Presidio的置信度阈值
+
+        Presidio始终按全局默认阈值过滤；指定了全局阈值时取两者较大值，
+        由Presidio一次完成过滤，无需再对结果做二次筛选。
+
+        Args:
+            score_threshold: 全局置信度阈值，None时使用配置文件中的按类型阈值
+            thresholds: 阈值配置，None时读取全局配置
+
+        Returns:
+            Presidio使用的阈值
+        """
+        if thresholds is None:
+            thresholds = settings.score_thresholds
+        default_threshold = thresholds.default
+        if score_threshold is None:
+            return default_threshold
+        return max(score_threshold, default_threshold)
+
+    @classmethod
+    def _may_contain_regex_pii(cls, text: str) -> bool:
+        """
+        检查文本是否可能被正则类识别器命中
+
+        手机号、身份证、银行卡、护照的匹配都包含数字，邮箱必须包含"@"。
+        一次扫描即可判断所有正则识别器是否有可能产生结果。
+
+        Args:
+            text: 待检查的文本
+
+        Returns:
+            是否可能包含正则类PII
+        """
+        return cls._REGEX_CANDIDATE_PATTERN.search(text) is not None
+
+    @classmethod
+    def _unmatchable_regex_entities(cls, text: str) -> frozenset[str]:
+        """
+        找出文本中不可能命中的正则类实体
+
+        一次扫描统计文本中的数字个数，数字少于某类实体所需位数时该类识别器必然无结果；
+        不含"@"时邮箱识别器必然无结果。据此跳过对应识别器，避免其逐个扫描全文。
+
+        Args:
+            text: 待检查的文本
+
+        Returns:
+            不可能命中的正则类实体类型集合
+        """
+        if not cls._may_contain_regex_pii(text):
+            return cls.REGEX_ENTITIES
+        digit_count = len(cls._NON_DIGIT_PATTERN.sub("", text))
+        unmatchable = {
+            entity for entity, required in cls._REGEX_ENTITY_MIN_DIGITS if digit_count < required
+        }
+        if "@" not in text:
+            unmatchable.add("CN_EMAIL")
+        return frozenset(unmatchable)
+
+    def _skippable_regex_entities(self, text: str) -> frozenset[str]:
+        """
+        找出本次分析可以跳过的正则类实体
+
+        预过滤依据的是内置识别器的匹配条件，自定义识别器可能匹配更短的文本，
+        因此由自定义识别器支持的实体类型始终保留。
+
+        Args:
+            text: 待检查的文本
+
+        Returns:
+            可以跳过的实体类型集合
+        """
+        unmatchable = self._unmatchable_regex_entities(text)
+        if unmatchable and self._custom_entities:
+            return unmatchable - self._custom_entities
+        return unmatchable
+
+    def _without_regex_entities(
+        self,
+        entities: list[str] | None,
+        language: str,
+        excluded: frozenset[str] = REGEX_ENTITIES,
+    ) -> list[str]:
+        """
+        从待识别实体类型中移除正则类实体
+
+        Args:
+            entities: 要识别的PII类型列表，None表示识别所有类型
+            language: 语言代码
+            excluded: 要移除的实体类型，默认为全部正则类实体
+
+        Returns:
+            去除指定实体后的实体类型列表
+        """
+        requested = entities or self.get_supported_entities(language)
+        return [e for e in requested if e not in excluded]
+
+    def _apply_priority_filter(
+        self,
+        results: list[RecognizerResult],
+        thresholds: ScoreThresholdSettings | None = None,
+    ) -> list[RecognizerResult]:
+        """
+        应用阈值过滤与优先级过滤
 
         当多个识别结果重叠时，保留高优先级的结果。
         优先级规则：身份证 > 银行卡 > 手机号 > 护照 > 邮箱 > 姓名 > 地址
 
+        结果按起始位置排序后单次扫描。已保留的结果两两不重叠，
+        因此可能与当前结果重叠的只有最后一个已保留结果，每个结果只需比较一次。
+        传入阈值配置时，低于其类型阈值的结果在同一次扫描中丢弃。
+
         Args:
             results: 原始识别结果列表
+            thresholds: 按类型过滤使用的阈值配置，None表示不按类型过滤
 
         Returns:
             过滤后的识别结果列表
         """
-        if not results or len(results) <= 1:
+        if not results or (len(results) == 1 and thresholds is None):
             return results
 
-        priority_settings = settings.pii_priorities
-        filtered: list[RecognizerResult] = []
-
         # 按起始位置排序
         sorted_results = sorted(results, key=lambda r: (r.start, r.end))
 
-        for result in sorted_results:
-            # 检查是否与已保留的结果重叠
-            should_add = True
-            result_priority = priority_settings.get_priority(result.entity_type)
-
-            # 检查与已保留结果的重叠情况
-            to_remove: list[int] = []
-            for i, existing in enumerate(filtered):
-                existing_priority = priority_settings.get_priority(existing.entity_type)
-
-                # 检查是否重叠
-                if self._results_overlap(result, existing):
-                    if result_priority < existing_priority:
-                        # 新结果优先级更高，标记移除旧结果
-                        to_remove.append(i)
-                        logger.debug(
-                            f"优先级过滤: {result.entity_type}(优先级{result_priority}) "
-                            f"覆盖 {existing.entity_type}(优先级{existing_priority}) "
-                            f"位置[{result.start}:{result.end}] vs [{existing.start}:{existing.end}]"
-                        )
-                    else:
-                        # 已有结果优先级更高或相等，不添加新结果
-                        should_add = False
-                        logger.debug(
-                            f"优先级过滤: {existing.entity_type}(优先级{existing_priority}) "
-                            f"保留，忽略 {result.entity_type}(优先级{result_priority}) "
-                            f"位置[{existing.start}:{existing.end}] vs [{result.start}:{result.end}]"
-                        )
-                        break
-
-            # 移除被覆盖的低优先级结果
-            for i in reversed(to_remove):
-                filtered.pop(i)
-
-            if should_add:
-                filtered.append(result)
+        if thresholds is not None:
+            get_threshold = thresholds.threshold_getter()
+            default_threshold = thresholds.default
 
-        return filtered
+        get_priority = self._priorities.priority_getter()
+        default = PIIPrioritySettings.DEFAULT_PRIORITY
 
-    @staticmethod
-    def _results_overlap(r1: RecognizerResult, r2: RecognizerResult) -> bool:
-        """
-        检查两个识别结果是否重叠
+        filtered: list[RecognizerResult] = []
+        last_end = 0
+        last_priority = default
+        for result in sorted_results:
+            if thresholds is not None and result.score < get_threshold(
+                result.entity_type, default_threshold
+            ):
+                continue
 
-        两个结果重叠的定义：它们的文本范围有交集
+            priority = get_priority(result.entity_type, default)
+            if filtered and result.start < last_end:
+                last = filtered[-1]
+                if priority < last_priority:
+                    # 新结果优先级更高，替换最后一个已保留结果
+                    filtered[-1] = result
+                    logger.debug(
+                        "优先级过滤: {}(优先级{}) 覆盖 {}(优先级{}) 位置[{}:{}] vs [{}:{}]",
+                        result.entity_type,
+                        priority,
+                        last.entity_type,
+                        last_priority,
+                        result.start,
+                        result.end,
+                        last.start,
+                        last.end,
+                    )
+                else:
+                    # 已有结果优先级更高或相等，不添加新结果
+                    logger.debug(
+                        "优先级过滤: {}(优先级{}) 保留，忽略 {}(优先级{}) 位置[{}:{}] vs [{}:{}]",
+                        last.entity_type,
+                        last_priority,
+                        result.entity_type,
+                        priority,
+                        last.start,
+                        last.end,
+                        result.start,
+                        result.end,
+                    )
+                    continue
+            else:
+                filtered.append(result)
 
-        Args:
-            r1: 第一个识别结果
-            r2: 第二个识别结果
+            last_end = result.end
+            last_priority = priority
 
-        Returns:
-            是否重叠
-        """
-        return r1.start < r2.end and r2.start < r1.end
+        return filtered
 
     def _precompute_ie_results(self, texts: list[str]) -> None:
         """
@@ -358,23 +813,20 @@ class CNPIIAnalyzerEngine:
         if not self._ie_engine:
             return
 
-        # 去重文本
-        unique_texts = list({text for text in texts if text and text.strip()})
+        # 单次有序遍历去重，顺序与输入一致，保证IE批次输入稳定
+        unique_texts = list(dict.fromkeys(text for text in texts if text and text.strip()))
         if not unique_texts:
             return
 
         # 预过滤：只保留可能包含姓名或地址的文本
         filtered_texts = self._filter_texts_for_ie(unique_texts)
-        logger.debug(
-            f"IE预过滤: {len(unique_texts)} -> {len(filtered_texts)} 个文本"
-        )
+        logger.debug("IE预过滤: {} -> {} 个文本", len(unique_texts), len(filtered_texts))
 
         if not filtered_texts:
             # 所有文本都被过滤，设置空缓存
             empty_cache = {text: [] for text in unique_texts}
-            for recognizer in self._registry.recognizers:
-                if hasattr(recognizer, "set_ie_cache"):
-                    recognizer.set_ie_cache(empty_cache)
+            for recognizer in self._ie_recognizers:
+                recognizer.set_ie_cache(empty_cache)
             return
 
         # 批量调用IE引擎（只处理过滤后的文本）
@@ -382,15 +834,15 @@ class CNPIIAnalyzerEngine:
 
         # 为被过滤的文本添加空结果
         for text in unique_texts:
-            if text not in ie_results:
-                ie_results[text] = []
+            ie_results.setdefault(text, [])
 
         # 将结果缓存到识别器
-        for recognizer in self._registry.recognizers:
-            if hasattr(recognizer, "set_ie_cache"):
-                recognizer.set_ie_cache(ie_results)
+        for recognizer in self._ie_recognizers:
+            recognizer.set_ie_cache(ie_results)
 
-        logger.debug(f"IE结果预计算完成，处理 {len(filtered_texts)} 个文本（原 {len(unique_texts)} 个）")
+        logger.debug(
+            "IE结果预计算完成，处理 {} 个文本（原 {} 个）", len(filtered_texts), len(unique_texts)
+        )
 
     def _filter_texts_for_ie(self, texts: list[str]) -> list[str]:
         """
@@ -408,45 +860,6 @@ class CNPIIAnalyzerEngine:
         Returns:
             过滤后的文本列表
         """
-        import re
-
-        # 标签类文本（不需要IE识别）
-        label_patterns = [
-            r"^身份证号",
-            r"^联系方式",
-            r"^手机号码",
-            r"^电子邮箱",
-            r"^家庭住址",
-            r"^护照号码",
-            r"^钱包与支付",
-            r"^储蓄卡",
-            r"^已通过实名认证",
-            r"^银行卡",
-            r"^信用卡",
-            r"^借记卡",
-            r"^开户行",
-            r"^持卡人",
-            r"^有效期",
-            r"^安全码",
-            r"^CVV",
-            r"^银行",
-            r"^中国银行",
-            r"^工商银行",
-            r"^建设银行",
-            r"^农业银行",
-            r"^招商银行",
-            r"^BANK",
-            r"^OF",
-            r"^CHINA",
-        ]
-
-        # 编译正则
-        label_re = re.compile("|".join(label_patterns), re.IGNORECASE)
-
-        # 纯数字/字母/特殊字符的正则
-        pure_number_re = re.compile(r"^[\d\s\-+\.]+$")
-        pure_alpha_num_re = re.compile(r"^[a-zA-Z0-9\s\-_\.@]+$")
-
         filtered = []
         for text in texts:
             text_stripped = text.strip()
@@ -456,17 +869,17 @@ class CNPIIAnalyzerEngine:
                 continue
 
             # 纯数字文本
-            if pure_number_re.match(text_stripped):
+            if self._IE_PURE_NUMBER_PATTERN.match(text_stripped):
                 continue
 
             # 纯英文/数字组合（邮箱、护照号等）
-            if pure_alpha_num_re.match(text_stripped) and not any(
+            if self._IE_PURE_ALPHA_NUM_PATTERN.match(text_stripped) and not any(
                 "\u4e00" <= c <= "\u9fff" for c in text_stripped
             ):
                 continue
 
             # 标签类文本
-            if label_re.match(text_stripped):
+            if self._IE_LABEL_PATTERN.match(text_stripped):
                 continue
 
             filtered.append(text)
@@ -480,8 +893,13 @@ class CNPIIAnalyzerEngine:
         Args:
             recognizer: 自定义识别器实例
         """
+        self._ensure_ready()
         self._registry.add_recognizer(recognizer)
-        logger.info(f"已添加自定义识别器: {recognizer.supported_entities}")
+        self._custom_entities |= frozenset(recognizer.supported_entities)
+        if hasattr(recognizer, "set_ie_cache"):
+            self._ie_recognizers.append(recognizer)
+        self.clear_cache()
+        logger.info("已添加自定义识别器: {}", recognizer.supported_entities)
 
     def get_supported_entities(self, language: str = "zh") -> list[str]:
         """
@@ -493,6 +911,7 @@ class CNPIIAnalyzerEngine:
         Returns:
             支持的实体类型列表
         """
+        self._ensure_ready()
         return self._analyzer.get_supported_entities(language=language)
 
     def get_ie_engine(self) -> PaddleNLPInfoExtractionEngine | None:
@@ -502,6 +921,7 @@ class CNPIIAnalyzerEngine:
         Returns:
             信息抽取引擎实例
         """
+        self._ensure_ready()
         return self._ie_engine
 
     def update_name_lists(
@@ -525,18 +945,18 @@ class CNPIIAnalyzerEngine:
             ...     deny_list=["王五"]
             ... )
         """
-        for recognizer in self._registry.recognizers:
-            if isinstance(recognizer, CNNameRecognizer):
-                if allow_list is not None:
-                    recognizer.set_allow_list(allow_list)
-                if deny_list is not None:
-                    recognizer.set_deny_list(deny_list)
-                logger.info(
-                    f"姓名识别器列表已更新: "
-                    f"allow_list={recognizer.get_allow_list()}, "
-                    f"deny_list={recognizer.get_deny_list()}"
-                )
-                break
+        self._ensure_ready()
+        recognizer = self._name_recognizer
+        if allow_list is not None:
+            recognizer.set_allow_list(allow_list)
+        if deny_list is not None:
+            recognizer.set_deny_list(deny_list)
+        self.clear_cache()
+        logger.info(
+            "姓名识别器列表已更新: allow_list={}, deny_list={}",
+            recognizer.get_allow_list(),
+            recognizer.get_deny_list(),
+        )
 
     def get_name_recognizer_lists(self) -> dict[str, list[str]]:
         """
@@ -551,16 +971,16 @@ class CNPIIAnalyzerEngine:
             >>> print(lists["allow_list"])
             ['张三', '李四']
         """
-        for recognizer in self._registry.recognizers:
-            if isinstance(recognizer, CNNameRecognizer):
-                return {
-                    "allow_list": recognizer.get_allow_list(),
-                    "deny_list": recognizer.get_deny_list(),
-                }
-        return {"allow_list": [], "deny_list": []}
+        self._ensure_ready()
+        return {
+            "allow_list": self._name_recognizer.get_allow_list(),
+            "deny_list": self._name_recognizer.get_deny_list(),
+        }
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例（主要用于测试）"""
+        if cls._instance is not None and cls._initialized and cls._instance._batch_pool:
+            cls._instance._batch_pool.shutdown(wait=False)
         cls._instance = None
         cls._initialized = False
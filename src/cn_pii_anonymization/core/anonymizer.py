@@ -4,6 +4,11 @@
 封装Presidio AnonymizerEngine，提供中文PII匿名化处理能力。
 """
 
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, cast
+
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig, OperatorResult
 
@@ -12,6 +17,67 @@ from cn_pii_anonymization.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 操作符无状态，全局共享一个实例，避免每个实体重新创建
+_mask_operator = CNMaskOperator()
+_fake_operator = CNFakeOperator()
+
+# 默认掩码参数，按实体类型预先构建
+_DEFAULT_MASK_PARAMS: dict[str, dict[str, Any]] = {
+    "CN_PHONE_NUMBER": {"keep_prefix": 3, "keep_suffix": 4},
+    "CN_ID_CARD": {"keep_prefix": 6, "keep_suffix": 4},
+    "CN_BANK_CARD": {"keep_prefix": 4, "keep_suffix": 4},
+    "CN_PASSPORT": {"keep_prefix": 2, "keep_suffix": 2},
+    "CN_EMAIL": {"keep_prefix": 2, "keep_suffix": 0, "mask_email_domain": True},
+}
+
+
+@lru_cache(maxsize=64)
+def _mask_operator_config(
+    masking_char: str,
+    keep_prefix: int,
+    keep_suffix: int,
+    mask_email_domain: bool = False,
+) -> OperatorConfig:
+    """
+    按掩码参数缓存掩码操作符配置
+
+    Args:
+        masking_char: 掩码字符
+        keep_prefix: 保留前N位
+        keep_suffix: 保留后N位
+        mask_email_domain: 是否掩码邮箱域名
+
+    Returns:
+        操作符配置
+    """
+    params = {
+        "masking_char": masking_char,
+        "keep_prefix": keep_prefix,
+        "keep_suffix": keep_suffix,
+        "mask_email_domain": mask_email_domain,
+    }
+    return OperatorConfig(
+        "custom",
+        {"lambda": partial(_mask_operator.operate, params=params)},
+    )
+
+
+@lru_cache(maxsize=64)
+def _fake_operator_config(entity_type: str) -> OperatorConfig:
+    """
+    按实体类型缓存假名替换操作符配置
+
+    Args:
+        entity_type: PII实体类型
+
+    Returns:
+        操作符配置
+    """
+    return OperatorConfig(
+        "custom",
+        {"lambda": partial(_fake_operator.operate, params={"entity_type": entity_type})},
+    )
+
 
 class CNPIIAnonymizerEngine:
     """
@@ -22,7 +88,7 @@ class CNPIIAnonymizerEngine:
 
     Attributes:
         _anonymizer: Presidio匿名化引擎实例
-        _operators: 自定义操作符配置字典
+        _operators: 自定义操作符配置的只读视图
 
     Example:
         >>> engine = CNPIIAnonymizerEngine()
@@ -37,6 +103,9 @@ class CNPIIAnonymizerEngine:
     _instance: "CNPIIAnonymizerEngine | None" = None
     _initialized: bool = False
 
+    # 单例实例属性固定，使用槽位存储，不创建实例__dict__
+    __slots__ = ("_anonymizer", "_operator_map", "_operators")
+
     def __new__(cls) -> "CNPIIAnonymizerEngine":
         """单例模式，确保全局只有一个匿名化器实例"""
         if cls._instance is None:
@@ -59,53 +128,25 @@ class CNPIIAnonymizerEngine:
         self._anonymizer = AnonymizerEngine()
 
     def _setup_operators(self) -> None:
-        """设置自定义操作符"""
-        self._operators: dict[str, OperatorConfig] = {
-            "CN_PHONE_NUMBER": OperatorConfig(
-                "custom",
-                {
-                    "lambda": lambda x: CNMaskOperator().operate(
-                        x, {"keep_prefix": 3, "keep_suffix": 4}
-                    )
-                },
-            ),
-            "CN_ID_CARD": OperatorConfig(
-                "custom",
-                {
-                    "lambda": lambda x: CNMaskOperator().operate(
-                        x, {"keep_prefix": 6, "keep_suffix": 4}
-                    )
-                },
-            ),
-            "CN_BANK_CARD": OperatorConfig(
-                "custom",
-                {
-                    "lambda": lambda x: CNMaskOperator().operate(
-                        x, {"keep_prefix": 4, "keep_suffix": 4}
-                    )
-                },
-            ),
-            "CN_PASSPORT": OperatorConfig(
-                "custom",
-                {
-                    "lambda": lambda x: CNMaskOperator().operate(
-                        x, {"keep_prefix": 2, "keep_suffix": 2}
-                    )
-                },
-            ),
-            "CN_EMAIL": OperatorConfig(
-                "custom",
-                {
-                    "lambda": lambda x: CNMaskOperator().operate(
-                        x, {"keep_prefix": 2, "keep_suffix": 0, "mask_email_domain": True}
-                    )
-                },
-            ),
-            "CN_ADDRESS": OperatorConfig(
-                "replace",
-                {"new_value": "<CN_ADDRESS>"},
-            ),
+        """
+        设置自定义操作符
+
+        预先放入DEFAULT操作符（与Presidio默认行为一致的replace），
+        Presidio发现已配置DEFAULT时不会再修改传入的字典，
+        因此无自定义操作符时可直接传入只读视图，无需每次复制。
+        """
+        self._operator_map: dict[str, OperatorConfig] = {
+            entity_type: OperatorConfig(
+                "custom", {"lambda": partial(_mask_operator.operate, params=params)}
+            )
+            for entity_type, params in _DEFAULT_MASK_PARAMS.items()
         }
+        self._operator_map["CN_ADDRESS"] = OperatorConfig(
+            "replace",
+            {"new_value": "<CN_ADDRESS>"},
+        )
+        self._operator_map["DEFAULT"] = OperatorConfig("replace")
+        self._operators: Mapping[str, OperatorConfig] = MappingProxyType(self._operator_map)
 
     def anonymize(
         self,
@@ -137,19 +178,22 @@ class CNPIIAnonymizerEngine:
             ...     }
             ... )
         """
-        logger.debug(f"开始匿名化处理，文本长度: {len(text)}")
+        logger.debug("开始匿名化处理，文本长度: {}", len(text))
 
-        merged_operators = self._operators.copy()
         if operators:
-            merged_operators.update(operators)
+            merged_operators: Mapping[str, OperatorConfig] = {**self._operator_map, **operators}
+        else:
+            merged_operators = self._operators
 
+        # Presidio仅在缺少DEFAULT时写入operators["DEFAULT"]；_operator_map始终包含DEFAULT，
+        # 因此只读视图不会被写入，按其声明的dict类型传入
         result = self._anonymizer.anonymize(
             text=text,
             analyzer_results=analyzer_results,
-            operators=merged_operators,
+            operators=cast(dict[str, OperatorConfig], merged_operators),
         )
 
-        logger.debug(f"匿名化完成，处理了 {len(result.items)} 个PII实体")
+        logger.debug("匿名化完成，处理了 {} 个PII实体", len(result.items))
         return result
 
     def set_operator(
@@ -171,7 +215,7 @@ class CNPIIAnonymizerEngine:
             ...     OperatorConfig("fake", {"entity_type": "CN_PHONE_NUMBER"})
             ... )
         """
-        self._operators[entity_type] = operator_config
+        self._operator_map[entity_type] = operator_config
         logger.info(f"已设置 {entity_type} 的匿名化操作: {operator_config.operator_name}")
 
     def get_mask_operator(
@@ -189,21 +233,9 @@ class CNPIIAnonymizerEngine:
             keep_suffix: 保留后N位
 
         Returns:
-            操作符配置
+            操作符配置，参数相同时返回同一个配置对象
         """
-        return OperatorConfig(
-            "custom",
-            {
-                "lambda": lambda x: CNMaskOperator().operate(
-                    x,
-                    {
-                        "masking_char": masking_char,
-                        "keep_prefix": keep_prefix,
-                        "keep_suffix": keep_suffix,
-                    },
-                )
-            },
-        )
+        return _mask_operator_config(masking_char, keep_prefix, keep_suffix)
 
     def get_fake_operator(self, entity_type: str) -> OperatorConfig:
         """
@@ -213,12 +245,9 @@ class CNPIIAnonymizerEngine:
             entity_type: PII实体类型
 
         Returns:
-            操作符配置
+            操作符配置，实体类型相同时返回同一个配置对象
         """
-        return OperatorConfig(
-            "custom",
-            {"lambda": lambda x: CNFakeOperator().operate(x, {"entity_type": entity_type})},
-        )
+        return _fake_operator_config(entity_type)
 
     @classmethod
     def reset(cls) -> None:
@@ -4,7 +4,9 @@
 封装Presidio ImageRedactorEngine，提供图像PII识别和脱敏能力。
 """
 
-from typing import Any
+import re
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, ClassVar
 
 from PIL import Image
 
@@ -38,6 +40,9 @@ class CNPIIImageRedactorEngine:
         >>> result.save("redacted_document.png")
     """
 
+    # 可能包含PII的文本至少含有一个文字、数字或字母，纯标点/符号的OCR框无需分析
+    _PII_CANDIDATE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\w")
+
     _instance: "CNPIIImageRedactorEngine | None" = None
     _initialized: bool = False
 
@@ -96,14 +101,8 @@ class CNPIIImageRedactorEngine:
         """
         logger.info(f"开始图像脱敏处理，图像尺寸: {image.size}")
 
-        if not self._ocr_engine.is_available():
-            raise OCRError("OCR引擎不可用，请确保已正确安装PaddleOCR")
-
-        ocr_result = self._perform_ocr(image)
-        self._ocr_result_cache = ocr_result
-
-        pii_bboxes = self._analyze_ocr_result(
-            ocr_result=ocr_result,
+        pii_bboxes = self.analyze(
+            image,
             entities=entities,
             allow_list=allow_list,
             score_threshold=score_threshold,
@@ -127,6 +126,47 @@ class CNPIIImageRedactorEngine:
         logger.info(f"图像脱敏完成，处理了 {len(merged_bboxes)} 个PII区域")
         return processed_image
 
+    def analyze(
+        self,
+        image: Image.Image,
+        entities: list[str] | None = None,
+        allow_list: list[str] | None = None,
+        score_threshold: float | None = None,
+    ) -> list[tuple[str, str, int, int, int, int, float]]:
+        """
+        识别图像中的PII，不进行脱敏
+
+        只执行OCR与PII分析，不复制图像也不应用马赛克。
+        OCR结果与PII边界框同样会被缓存，可通过get_ocr_result/get_pii_bboxes获取。
+
+        Args:
+            image: PIL图像对象
+            entities: 要识别的PII类型列表，None表示识别所有类型
+            allow_list: 白名单列表，匹配的内容将被排除
+            score_threshold: 置信度阈值，None时使用配置文件中的按类型阈值
+
+        Returns:
+            PII边界框列表，每个元素为 (entity_type, text, left, top, width, height, score)
+
+        Raises:
+            OCRError: OCR识别失败时抛出
+            PIIRecognitionError: PII识别失败时抛出
+        """
+        if not self._ocr_engine.is_available():
+            raise OCRError("OCR引擎不可用，请确保已正确安装PaddleOCR")
+
+        ocr_result = self._perform_ocr(image)
+        self._ocr_result_cache = ocr_result
+
+        pii_bboxes = self._analyze_ocr_result(
+            ocr_result=ocr_result,
+            entities=entities,
+            allow_list=allow_list,
+            score_threshold=score_threshold,
+        )
+        self._pii_bboxes_cache = pii_bboxes
+        return pii_bboxes
+
     def _perform_ocr(self, image: Image.Image) -> OCRResult:
         """
         执行OCR识别
@@ -171,22 +211,20 @@ class CNPIIImageRedactorEngine:
         if not boxes:
             return []
 
-        # 按垂直位置分组（同一行的文本框）
+        # 按垂直位置分组（同一行的文本框）：归入首个行首框top与其相差不超过阈值的行
         lines: list[list[tuple[str, int, int, int, int]]] = []
+        # 按行首框top排序的 (top, 行序号)，二分查找候选行，避免逐行比较
+        line_tops: list[tuple[int, int]] = []
 
         for box in boxes:
-            text, left, top, width, height = box
-            placed = False
-
-            for line in lines:
-                if line:
-                    _, _, ref_top, _, ref_height = line[0]
-                    if abs(top - ref_top) <= max_vertical_diff:
-                        line.append(box)
-                        placed = True
-                        break
-
-            if not placed:
+            top = box[2]
+            lo = bisect_left(line_tops, (top - max_vertical_diff, -1))
+            hi = bisect_right(line_tops, (top + max_vertical_diff, len(lines)))
+
+            if lo < hi:
+                lines[min(index for _, index in line_tops[lo:hi])].append(box)
+            else:
+                insort(line_tops, (top, len(lines)))
                 lines.append([box])
 
         merged_boxes: list[tuple[str, int, int, int, int]] = []
@@ -218,7 +256,7 @@ class CNPIIImageRedactorEngine:
                 (current_text, current_left, current_top, current_width, current_height)
             )
 
-        logger.debug(f"相邻文本框合并: {len(boxes)} -> {len(merged_boxes)} 个")
+        logger.debug("相邻文本框合并: {} -> {} 个", len(boxes), len(merged_boxes))
         return merged_boxes
 
     def _analyze_ocr_result(
@@ -259,22 +297,22 @@ class CNPIIImageRedactorEngine:
             # 合并相邻文本框，解决OCR分割问题
             boxes = self._merge_adjacent_text_boxes(boxes)
 
-            # 预过滤白名单和去重
+            # 预过滤白名单、纯标点/符号文本并去重
+            allowed = frozenset(allow_list) if allow_list else frozenset()
+            candidate = self._PII_CANDIDATE_PATTERN.search
             unique_texts: dict[str, list[tuple[int, int, int, int]]] = {}
             for text, left, top, width, height in boxes:
-                if allow_list and text in allow_list:
+                if text in allowed or not candidate(text):
                     continue
-                if text not in unique_texts:
-                    unique_texts[text] = []
-                unique_texts[text].append((left, top, width, height))
+                unique_texts.setdefault(text, []).append((left, top, width, height))
 
             if not unique_texts:
                 return pii_bboxes
 
-            # 使用批量分析方法（会预先调用IE引擎并缓存结果）
-            texts_to_analyze = list(unique_texts.keys())
+            # 所有文本框一次批量分析（一次IE批量调用、一次LAC批量分词）
+            # 不拼接成一个长文本：框与框之间没有语义上下文，拼接会让姓名/地址跨框误识别
             analysis_results = self._analyzer.analyze_batch(
-                texts=texts_to_analyze,
+                texts=list(unique_texts),
                 entities=entities,
                 score_threshold=score_threshold,
             )
@@ -288,12 +326,13 @@ class CNPIIImageRedactorEngine:
                         pii_bboxes.append(
                             (result.entity_type, text, left, top, width, height, result.score)
                         )
-                        logger.debug(
-                            f"发现PII: {text[:20]}... (类型: {result.entity_type}, 置信度: {result.score:.2f})"
-                        )
-
-            # 缓存PII边界框结果
-            self._pii_bboxes_cache = pii_bboxes
+                    logger.debug(
+                        "发现PII: {}... (类型: {}, 置信度: {:.2f}, 位置数: {})",
+                        text[:20],
+                        result.entity_type,
+                        result.score,
+                        len(bbox_list),
+                    )
 
             return pii_bboxes
 
@@ -311,6 +350,7 @@ class CNPIIImageRedactorEngine:
 
         使用迭代合并算法，每次合并后重新检查是否有新的重叠，
         直到没有更多合并为止。这确保了所有应该合并的框都会被正确合并。
+        每轮先按左边界排序，内层扫描遇到左边界超出当前框右边界时即可提前结束。
 
         Args:
             bboxes: 边界框列表，格式为 (entity_type, text, left, top, width, height, score)
@@ -322,42 +362,17 @@ class CNPIIImageRedactorEngine:
         if not bboxes:
             return []
 
-        expanded_boxes = []
-        for _entity_type, _text, left, top, width, height, _score in bboxes:
-            expanded_boxes.append(
-                (
-                    left - padding,
-                    top - padding,
-                    left + width + padding,
-                    top + height + padding,
-                )
-            )
-
-        def boxes_overlap(box1: tuple[int, int, int, int], box2: tuple[int, int, int, int]) -> bool:
-            """检查两个框是否重叠或相邻"""
-            return (
-                box1[0] <= box2[2]
-                and box2[0] <= box1[2]
-                and box1[1] <= box2[3]
-                and box2[1] <= box1[3]
-            )
-
-        def merge_two_boxes(
-            box1: tuple[int, int, int, int], box2: tuple[int, int, int, int]
-        ) -> tuple[int, int, int, int]:
-            """合并两个框"""
-            return (
-                min(box1[0], box2[0]),
-                min(box1[1], box2[1]),
-                max(box1[2], box2[2]),
-                max(box1[3], box2[3]),
-            )
-
-        merged = list(expanded_boxes)
+        merged = [
+            (left - padding, top - padding, left + width + padding, top + height + padding)
+            for _entity_type, _text, left, top, width, height, _score in bboxes
+        ]
+        box_count = len(merged)
 
         changed = True
         while changed:
             changed = False
+            # 按左边界排序后，只需向右扫描到左边界超出当前框右边界为止
+            merged.sort()
             new_merged = []
             used = [False] * len(merged)
 
@@ -365,25 +380,30 @@ class CNPIIImageRedactorEngine:
                 if used[i]:
                     continue
 
-                current_box = merged[i]
+                left, top, right, bottom = merged[i]
                 used[i] = True
 
                 for j in range(i + 1, len(merged)):
+                    other_left, other_top, other_right, other_bottom = merged[j]
+                    if other_left > right:
+                        break
                     if used[j]:
                         continue
 
-                    if boxes_overlap(current_box, merged[j]):
-                        current_box = merge_two_boxes(current_box, merged[j])
+                    if other_top <= bottom and top <= other_bottom:
+                        top = min(top, other_top)
+                        right = max(right, other_right)
+                        bottom = max(bottom, other_bottom)
                         used[j] = True
                         changed = True
 
-                new_merged.append(current_box)
+                new_merged.append((left, top, right, bottom))
 
             merged = new_merged
 
         merged.sort(key=lambda x: (x[1], x[0]))
 
-        logger.debug(f"边界框合并: {len(expanded_boxes)} -> {len(merged)} 个")
+        logger.debug("边界框合并: {} -> {} 个", box_count, len(merged))
 
         return merged
 
@@ -416,11 +436,7 @@ class CNPIIImageRedactorEngine:
 
         operator = create_mosaic_operator(mosaic_style, **kwargs)
 
-        result = image.copy()
-        for bbox in bboxes:
-            result = operator.apply(result, bbox)
-
-        return result
+        return operator.apply_all(image, bboxes)
 
     def get_ocr_result(self) -> OCRResult | None:
         """
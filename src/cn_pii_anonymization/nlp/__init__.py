@@ -4,8 +4,10 @@ NLP引擎模块
 提供中文NLP处理能力，包括：
 - PaddleNLP LAC引擎：分词和词性标注
 - PaddleNLP信息抽取引擎：姓名和地址识别
+- 信息抽取结果磁盘缓存
 """
 
+from cn_pii_anonymization.nlp.ie_cache import IEResultDiskCache
 from cn_pii_anonymization.nlp.ie_engine import PaddleNLPInfoExtractionEngine
 from cn_pii_anonymization.nlp.nlp_engine import (
     PaddleNlpArtifacts,
@@ -14,6 +16,7 @@ from cn_pii_anonymization.nlp.nlp_engine import (
 )
 
 __all__ = [
+    "IEResultDiskCache",
     "PaddleNLPEngine",
     "PaddleNLPInfoExtractionEngine",
     "PaddleNlpArtifacts",
@@ -0,0 +1,137 @@
+"""
+信息抽取结果磁盘缓存模块
+
+将PaddleNLP信息抽取结果持久化到本地SQLite文件，
+服务重启或重复扫描相同语料时可直接复用，避免重复模型推理。
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import ClassVar
+
+from cn_pii_anonymization.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class IEResultDiskCache:
+    """
+    信息抽取结果磁盘缓存
+
+    缓存键为schema与文本的BLAKE2b摘要，schema变化后旧结果自动失效。
+    结果以JSON形式保存在SQLite文件中，条数超过上限时淘汰最早写入的记录。
+
+    Attributes:
+        path: 缓存文件路径
+        max_entries: 最大缓存条数
+
+    Example:
+        >>> cache = IEResultDiskCache("cache/ie_cache.sqlite3")
+        >>> cache.set_many({"张三住在北京": [{"姓名": [...]}]}, schema=["姓名"])
+        >>> cache.get_many(["张三住在北京"], schema=["姓名"])
+    """
+
+    DEFAULT_MAX_ENTRIES: ClassVar[int] = 100_000
+    QUERY_CHUNK_SIZE: ClassVar[int] = 500
+
+    def __init__(self, path: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        初始化磁盘缓存
+
+        Args:
+            path: 缓存文件路径，父目录不存在时自动创建
+            max_entries: 最大缓存条数
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ie_results (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        logger.debug("IE结果磁盘缓存已打开: {}", self.path)
+
+    @staticmethod
+    def _schema_key(schema: Iterable[str]) -> bytes:
+        """计算schema摘要，作为文本摘要的密钥"""
+        return hashlib.blake2b("\x1f".join(schema).encode("utf-8"), digest_size=32).digest()
+
+    @staticmethod
+    def _text_key(text: str, schema_key: bytes) -> str:
+        """计算文本在指定schema下的缓存键"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16, key=schema_key).hexdigest()
+
+    def get_many(self, texts: Iterable[str], schema: Iterable[str]) -> dict[str, list[dict]]:
+        """
+        批量读取缓存结果
+
+        Args:
+            texts: 待查询的文本
+            schema: 抽取schema
+
+        Returns:
+            命中缓存的文本到抽取结果的映射
+        """
+        schema_key = self._schema_key(schema)
+        keys = {self._text_key(text, schema_key): text for text in texts}
+        if not keys:
+            return {}
+
+        key_list = list(keys)
+        rows: list[tuple[str, str]] = []
+        with self._lock:
+            # 分批查询，避免超出SQLite单条语句的参数数量上限
+            for start in range(0, len(key_list), self.QUERY_CHUNK_SIZE):
+                chunk = key_list[start : start + self.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self._conn.execute(
+                        f"SELECT key, value FROM ie_results WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        return {keys[key]: json.loads(value) for key, value in rows}
+
+    def set_many(self, results: dict[str, list[dict]], schema: Iterable[str]) -> None:
+        """
+        批量写入抽取结果
+
+        Args:
+            results: 文本到抽取结果的映射
+            schema: 抽取schema
+        """
+        if not results:
+            return
+
+        schema_key = self._schema_key(schema)
+        rows = [
+            (self._text_key(text, schema_key), json.dumps(value, ensure_ascii=False))
+            for text, value in results.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ie_results (key, value) VALUES (?, ?)", rows
+            )
+            self._conn.execute(
+                "DELETE FROM ie_results WHERE rowid <= "
+                "(SELECT MAX(rowid) FROM ie_results) - ?",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._conn.execute("DELETE FROM ie_results")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """关闭缓存文件"""
+        with self._lock:
+            self._conn.close()
@@ -5,19 +5,11 @@ PaddleNLP信息抽取引擎模块
 用于姓名和地址的精确识别。
 """
 
-import os
-
-os.environ["FLAGS_use_mkldnn"] = "0"
-os.environ["FLAGS_enable_onednn_backend"] = "0"
-os.environ["FLAGS_disable_onednn_backend"] = "1"
-os.environ["FLAGS_enable_pir_api"] = "0"
-os.environ["FLAGS_json_format_model"] = "0"
-os.environ["PADDLE_PDX_USE_PIR_TRT"] = "0"
-os.environ["PADDLE_PDX_ENABLE_MKLDNN_BYDEFAULT"] = "0"
-os.environ["PADDLE_PDX_MODEL_SOURCE"] = "bos"
+import cn_pii_anonymization.utils.paddle_env  # noqa: F401  # isort: skip
 
 from typing import Any, ClassVar
 
+from cn_pii_anonymization.nlp.ie_cache import IEResultDiskCache
 from cn_pii_anonymization.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +27,7 @@ class PaddleNLPInfoExtractionEngine:
     Attributes:
         _ie_engine: 信息抽取Taskflow实例
         _schema: 抽取schema，定义要识别的实体类型
+        _cache: 批量抽取结果的磁盘缓存
 
     Example:
         >>> engine = PaddleNLPInfoExtractionEngine()
@@ -51,6 +44,7 @@ class PaddleNLPInfoExtractionEngine:
         self,
         schema: list[str] | None = None,
         use_gpu: bool = False,
+        cache: IEResultDiskCache | None = None,
     ) -> None:
         """
         初始化信息抽取引擎
@@ -58,9 +52,11 @@ class PaddleNLPInfoExtractionEngine:
         Args:
             schema: 要抽取的实体类型列表，默认为['地址', '姓名']
             use_gpu: 是否使用GPU加速
+            cache: 批量抽取结果的磁盘缓存，为None时不缓存
         """
         self._schema = schema or self.DEFAULT_SCHEMA.copy()
         self._use_gpu = use_gpu
+        self._cache = cache
         self._ie_engine: Any = None
         self._initialized = False
         self._init_error: str | None = None
@@ -149,41 +145,87 @@ class PaddleNLPInfoExtractionEngine:
         if not texts:
             return {}
 
-        # 过滤空文本并建立映射
-        valid_texts = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+        # 过滤空文本
+        valid_texts = [text for text in texts if text and text.strip()]
         if not valid_texts:
             return {}
 
+        # 命中磁盘缓存的文本不再进入模型
+        results_map = self._get_cached_results(valid_texts)
+        pending = [text for text in valid_texts if text not in results_map]
+        if not pending:
+            logger.debug("批量信息抽取全部命中磁盘缓存: {} 个文本", len(valid_texts))
+            return results_map
+
         try:
             self._init_ie_engine()
 
             if self._ie_engine is None:
                 logger.warning("信息抽取引擎未初始化，无法进行批量抽取")
-                return {text: [] for _, text in valid_texts}
+                results_map.update({text: [] for text in pending})
+                return results_map
 
             # 批量调用IE引擎
-            batch_texts = [text for _, text in valid_texts]
-            batch_results = self._ie_engine(batch_texts)
+            batch_results = self._ie_engine(pending)
 
             # 构建结果映射
             # 注意：批量调用返回的是 [dict, dict, ...] 格式
             # 而单个调用返回的是 [dict] 格式
             # 为了保持一致性，需要将批量结果包装成列表格式
-            results_map: dict[str, list[dict]] = {}
-            for (_orig_idx, orig_text), result in zip(valid_texts, batch_results, strict=False):
+            extracted: dict[str, list[dict]] = {}
+            for text, result in zip(pending, batch_results, strict=False):
                 # result 是一个字典，如 {'地址': [...], '姓名': [...]}
                 # 需要包装成列表格式 [{'地址': [...], '姓名': [...]}]
                 if result and isinstance(result, dict):
-                    results_map[orig_text] = [result]
+                    extracted[text] = [result]
                 else:
-                    results_map[orig_text] = []
+                    extracted[text] = []
 
-            logger.debug(f"批量信息抽取完成，处理 {len(valid_texts)} 个文本")
+            logger.debug(
+                "批量信息抽取完成，处理 {} 个文本，缓存命中 {} 个",
+                len(pending),
+                len(results_map),
+            )
+            self._store_cached_results(extracted)
+            results_map.update(extracted)
             return results_map
 
         except Exception as e:
             logger.error(f"批量信息抽取失败: {e}")
-            return {text: [] for _, text in valid_texts}
+            results_map.update({text: [] for text in pending})
+            return results_map
+
+    def _get_cached_results(self, texts: list[str]) -> dict[str, list[dict]]:
+        """
+        从磁盘缓存读取抽取结果
+
+        Args:
+            texts: 待查询的文本列表
+
+        Returns:
+            命中缓存的文本到抽取结果的映射，未启用缓存或读取失败时为空
+        """
+        if self._cache is None:
+            return {}
+        try:
+            return self._cache.get_many(texts, self._schema)
+        except Exception as e:
+            logger.warning("读取IE结果磁盘缓存失败: {}", e)
+            return {}
+
+    def _store_cached_results(self, results: dict[str, list[dict]]) -> None:
+        """
+        将抽取结果写入磁盘缓存，写入失败不影响本次抽取
+
+        Args:
+            results: 文本到抽取结果的映射
+        """
+        if self._cache is None:
+            return
+        try:
+            self._cache.set_many(results, self._schema)
+        except Exception as e:
+            logger.warning("写入IE结果磁盘缓存失败: {}", e)
 
     def extract_addresses(self, text: str) -> list[dict]:
         """
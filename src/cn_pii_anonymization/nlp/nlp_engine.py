@@ -5,17 +5,10 @@ PaddleNLP NLP引擎模块
 NER识别已迁移至ie_engine.py使用information_extraction方法。
 """
 
-import os
-
-os.environ["FLAGS_use_mkldnn"] = "0"
-os.environ["FLAGS_enable_onednn_backend"] = "0"
-os.environ["FLAGS_disable_onednn_backend"] = "1"
-os.environ["FLAGS_enable_pir_api"] = "0"
-os.environ["FLAGS_json_format_model"] = "0"
-os.environ["PADDLE_PDX_USE_PIR_TRT"] = "0"
-os.environ["PADDLE_PDX_ENABLE_MKLDNN_BYDEFAULT"] = "0"
-os.environ["PADDLE_PDX_MODEL_SOURCE"] = "bos"
+import cn_pii_anonymization.utils.paddle_env  # noqa: F401  # isort: skip
 
+import re
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
 from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -195,6 +188,11 @@ class PaddleNLPEngine:
         "\\",
     }
 
+    # 后备分词正则：连续汉字、英文单词、数字或单个非空白字符
+    SIMPLE_TOKEN_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"[\u4e00-\u9fa5]+|[a-zA-Z]+|[0-9]+|[^\s]"
+    )
+
     def __init__(self, use_gpu: bool = False) -> None:
         """
         初始化PaddleNLP引擎
@@ -245,11 +243,39 @@ class PaddleNLPEngine:
         Returns:
             分词结果列表
         """
-        import re
+        return self.SIMPLE_TOKEN_PATTERN.findall(text)
 
-        pattern = r"[\u4e00-\u9fa5]+|[a-zA-Z]+|[0-9]+|[^\s]"
-        tokens = re.findall(pattern, text)
-        return tokens
+    def _build_artifacts(self, tokens: list[str], language: str) -> PaddleNlpArtifacts:
+        """
+        根据分词结果构建NLP处理结果
+
+        Args:
+            tokens: 分词结果列表
+            language: 语言代码
+
+        Returns:
+            PaddleNlpArtifacts: NLP处理结果
+        """
+        tokens_indices = []
+        current_pos = 0
+        for token in tokens:
+            tokens_indices.append(current_pos)
+            current_pos += len(token)
+
+        return PaddleNlpArtifacts(
+            entities=[],
+            tokens=tokens,
+            tokens_indices=tokens_indices,
+            lemmas=tokens,
+            nlp_engine=self,
+            language=language,
+        )
+
+    @staticmethod
+    def _lac_tokens(result: dict[str, Any]) -> list[str]:
+        """从LAC单条输出中取出分词结果"""
+        tokens = result.get("segs", result.get("word", []))
+        return list(tokens) if tokens else []
 
     def process_text(self, text: str, language: str = "zh") -> PaddleNlpArtifacts:
         """
@@ -265,14 +291,7 @@ class PaddleNLPEngine:
             PaddleNlpArtifacts: NLP处理结果
         """
         if not text:
-            return PaddleNlpArtifacts(
-                entities=[],
-                tokens=[],
-                tokens_indices=[],
-                lemmas=[],
-                nlp_engine=self,
-                language=language,
-            )
+            return self._build_artifacts([], language)
 
         try:
             self._init_lac()
@@ -283,56 +302,63 @@ class PaddleNLPEngine:
                 if isinstance(result, list) and len(result) > 0:
                     result = result[0]
 
-                tokens = result.get("segs", result.get("word", []))
-
-                tokens_indices = []
-                current_pos = 0
-                for token in tokens:
-                    tokens_indices.append(current_pos)
-                    current_pos += len(token)
-
-                return PaddleNlpArtifacts(
-                    entities=[],
-                    tokens=list(tokens) if tokens else [],
-                    tokens_indices=tokens_indices,
-                    lemmas=list(tokens) if tokens else [],
-                    nlp_engine=self,
-                    language=language,
-                )
+                return self._build_artifacts(self._lac_tokens(result), language)
             else:
-                tokens = self._simple_tokenize(text)
-                tokens_indices = []
-                current_pos = 0
-                for token in tokens:
-                    tokens_indices.append(current_pos)
-                    current_pos += len(token)
-
-                return PaddleNlpArtifacts(
-                    entities=[],
-                    tokens=tokens,
-                    tokens_indices=tokens_indices,
-                    lemmas=tokens,
-                    nlp_engine=self,
-                    language=language,
-                )
+                return self._build_artifacts(self._simple_tokenize(text), language)
 
         except Exception as e:
             logger.error(f"NLP处理失败: {e}")
-            tokens = self._simple_tokenize(text)
-            tokens_indices = []
-            current_pos = 0
-            for token in tokens:
-                tokens_indices.append(current_pos)
-                current_pos += len(token)
-
-            return PaddleNlpArtifacts(
-                entities=[],
-                tokens=tokens,
-                tokens_indices=tokens_indices,
-                lemmas=tokens,
-                nlp_engine=self,
-                language=language,
-            )
+            return self._build_artifacts(self._simple_tokenize(text), language)
+
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        language: str = "zh",
+        **kwargs: Any,
+    ) -> list[tuple[str, PaddleNlpArtifacts]]:
+        """
+        批量处理文本，返回每个文本的NLP处理结果
+
+        所有非空文本通过一次LAC调用完成分词，避免逐条进入模型；
+        重复文本只处理一次。
+
+        Args:
+            texts: 待处理的文本
+            language: 语言代码
+            **kwargs: 兼容Presidio NlpEngine.process_batch接口的其他参数（忽略）
+
+        Returns:
+            (文本, NLP处理结果)列表，顺序与去重后的输入一致
+
+        Example:
+            >>> engine = PaddleNLPEngine()
+            >>> artifacts = dict(engine.process_batch(["张三", "李四"]))
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        non_empty = [text for text in unique_texts if text]
+        token_map: dict[str, list[str]] = {}
+
+        if non_empty:
+            try:
+                self._init_lac()
+
+                if self._lac is not None:
+                    results = self._lac(non_empty)
+                    for text, result in zip(non_empty, results, strict=True):
+                        token_map[text] = self._lac_tokens(result)
+            except Exception as e:
+                logger.error("NLP批量处理失败: {}", e)
+                token_map.clear()
+
+            # LAC不可用或批量处理失败时，使用后备分词
+            for text in non_empty:
+                if text not in token_map:
+                    token_map[text] = self._simple_tokenize(text)
+
+        return [
+            (text, self._build_artifacts(token_map.get(text, []), language))
+            for text in unique_texts
+        ]
 
     def is_stopword(self, word: str, language: str = "zh") -> bool:
         """
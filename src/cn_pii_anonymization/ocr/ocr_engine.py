@@ -4,18 +4,10 @@ OCR引擎模块
 封装PaddleOCR引擎，提供中文OCR识别能力。
 """
 
-import os
-
-os.environ["FLAGS_use_mkldnn"] = "0"
-os.environ["FLAGS_enable_onednn_backend"] = "0"
-os.environ["FLAGS_disable_onednn_backend"] = "1"
-os.environ["FLAGS_enable_pir_api"] = "0"
-os.environ["FLAGS_json_format_model"] = "0"
-os.environ["PADDLE_PDX_USE_PIR_TRT"] = "0"
-os.environ["PADDLE_PDX_ENABLE_MKLDNN_BYDEFAULT"] = "0"
-os.environ["PADDLE_PDX_MODEL_SOURCE"] = "bos"
+import cn_pii_anonymization.utils.paddle_env  # noqa: F401  # isort: skip
 
 import functools
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
@@ -252,8 +244,8 @@ class PaddleOCREngine(BaseOCREngine):
 
                 if self._model_dir:
                     model_path = Path(self._model_dir)
-                    det_model_dir = model_path / "PP-OCRv4_mobile_det"
-                    rec_model_dir = model_path / "PP-OCRv4_mobile_rec"
+                    det_model_dir = model_path / f"{self._ocr_version}_mobile_det"
+                    rec_model_dir = model_path / f"{self._ocr_version}_mobile_rec"
 
                     if det_model_dir.exists() and rec_model_dir.exists():
                         ocr_params["text_detection_model_dir"] = str(det_model_dir)
@@ -290,7 +282,8 @@ class PaddleOCREngine(BaseOCREngine):
 
             ocr = self._init_ocr()
 
-            img_array = np.array(image)
+            # asarray直接使用PIL导出的像素缓冲区，避免np.array再复制一次
+            img_array = np.asarray(image)
 
             if img_array.ndim == 2:
                 img_array = np.stack([img_array] * 3, axis=-1)
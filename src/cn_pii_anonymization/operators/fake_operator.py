@@ -31,9 +31,20 @@ class CNFakeOperator:
         >>> print(result)  # 输出假名，如：李四
     """
 
-    def __init__(self) -> None:
-        """初始化假名生成器"""
-        self._faker = Faker("zh_CN")
+    DEFAULT_LOCALE: ClassVar[str] = "zh_CN"
+
+    # Faker实例按locale缓存，所有操作符实例共享，避免重复加载locale数据
+    _faker_cache: ClassVar[dict[str, Faker]] = {}
+
+    def __init__(self, locale: str = DEFAULT_LOCALE) -> None:
+        """
+        初始化假名生成器
+
+        Args:
+            locale: Faker语言区域，默认为zh_CN
+        """
+        self._locale = locale
+        self._faker = self._get_faker(locale)
         self._fake_generators: dict[str, Any] = {
             "CN_NAME": self._generate_name,
             "CN_PHONE_NUMBER": self._generate_phone,
@@ -44,6 +55,26 @@ class CNFakeOperator:
             "CN_PASSPORT": self._generate_passport,
         }
 
+    @classmethod
+    def _get_faker(cls, locale: str) -> Faker:
+        """
+        获取指定locale的Faker实例
+
+        首次使用时创建并缓存，后续直接返回缓存实例。
+
+        Args:
+            locale: Faker语言区域
+
+        Returns:
+            Faker实例
+        """
+        faker = cls._faker_cache.get(locale)
+        if faker is None:
+            faker = Faker(locale)
+            cls._faker_cache[locale] = faker
+            logger.debug("已创建Faker实例: locale={}", locale)
+        return faker
+
     def operate(
         self,
         text: str,
@@ -5,6 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from enum import StrEnum
 from typing import Any
 
@@ -34,10 +35,10 @@ class MosaicOperator(ABC):
     """
     马赛克操作符抽象基类
 
-    定义马赛克操作的接口规范。
+    定义马赛克操作的接口规范。子类只需实现原地处理单个区域的 `_apply_region`，
+    `apply` 与 `apply_all` 负责复制图像，原图保持不变。
     """
 
-    @abstractmethod
     def apply(
         self,
         image: Image.Image,
@@ -53,7 +54,64 @@ class MosaicOperator(ABC):
         Returns:
             处理后的图像
         """
-        pass
+        return self.apply_all(image, [bbox])
+
+    def apply_all(
+        self,
+        image: Image.Image,
+        bboxes: Iterable[tuple[int, int, int, int]],
+    ) -> Image.Image:
+        """
+        对图像的多个区域应用马赛克效果
+
+        整张图像只复制一次，各区域在副本上原地处理，
+        避免逐个边界框调用 `apply` 时每次都复制整张图像。
+
+        Args:
+            image: PIL图像对象
+            bboxes: 边界框列表，每个元素为 (left, top, right, bottom)
+
+        Returns:
+            处理后的图像
+        """
+        result = image.copy()
+        for bbox in self._valid_bboxes(bboxes):
+            self._apply_region(result, bbox)
+        return result
+
+    @staticmethod
+    def _valid_bboxes(
+        bboxes: Iterable[tuple[int, int, int, int]],
+    ) -> Iterator[tuple[int, int, int, int]]:
+        """
+        过滤无效边界框
+
+        Args:
+            bboxes: 边界框列表
+
+        Yields:
+            宽高均为正的边界框
+        """
+        for bbox in bboxes:
+            x1, y1, x2, y2 = bbox
+            if x2 <= x1 or y2 <= y1:
+                logger.warning("无效的边界框: {}", bbox)
+                continue
+            yield bbox
+
+    @abstractmethod
+    def _apply_region(
+        self,
+        image: Image.Image,
+        bbox: tuple[int, int, int, int],
+    ) -> None:
+        """
+        在图像上原地处理单个区域
+
+        Args:
+            image: PIL图像对象（将被修改）
+            bbox: 有效的边界框 (left, top, right, bottom)
+        """
 
 
 class PixelMosaicOperator(MosaicOperator):
@@ -80,32 +138,23 @@ class PixelMosaicOperator(MosaicOperator):
         self._block_size = max(1, block_size)
         logger.debug(f"像素块马赛克操作符初始化: block_size={self._block_size}")
 
-    def apply(
+    def _apply_region(
         self,
         image: Image.Image,
         bbox: tuple[int, int, int, int],
-    ) -> Image.Image:
+    ) -> None:
         """
         应用像素块马赛克效果
 
         Args:
-            image: PIL图像对象
+            image: PIL图像对象（将被修改）
             bbox: 边界框 (left, top, right, bottom)
-
-        Returns:
-            处理后的图像
         """
-        result = image.copy()
         x1, y1, x2, y2 = bbox
-
         width = x2 - x1
         height = y2 - y1
 
-        if width <= 0 or height <= 0:
-            logger.warning(f"无效的边界框: {bbox}")
-            return result
-
-        region = result.crop((x1, y1, x2, y2))
+        region = image.crop(bbox)
 
         small_width = max(1, width // self._block_size)
         small_height = max(1, height // self._block_size)
@@ -120,10 +169,9 @@ class PixelMosaicOperator(MosaicOperator):
             resample=Image.Resampling.NEAREST,
         )
 
-        result.paste(mosaic, (x1, y1))
+        image.paste(mosaic, (x1, y1))
 
-        logger.debug(f"已应用像素块马赛克: bbox={bbox}")
-        return result
+        logger.debug("已应用像素块马赛克: bbox={}", bbox)
 
 
 class GaussianBlurOperator(MosaicOperator):
@@ -150,39 +198,25 @@ class GaussianBlurOperator(MosaicOperator):
         self._radius = max(1, radius)
         logger.debug(f"高斯模糊操作符初始化: radius={self._radius}")
 
-    def apply(
+    def _apply_region(
         self,
         image: Image.Image,
         bbox: tuple[int, int, int, int],
-    ) -> Image.Image:
+    ) -> None:
         """
         应用高斯模糊效果
 
         Args:
-            image: PIL图像对象
+            image: PIL图像对象（将被修改）
             bbox: 边界框 (left, top, right, bottom)
-
-        Returns:
-            处理后的图像
         """
-        result = image.copy()
-        x1, y1, x2, y2 = bbox
-
-        width = x2 - x1
-        height = y2 - y1
-
-        if width <= 0 or height <= 0:
-            logger.warning(f"无效的边界框: {bbox}")
-            return result
-
-        region = result.crop((x1, y1, x2, y2))
+        region = image.crop(bbox)
 
         blurred = region.filter(ImageFilter.GaussianBlur(self._radius))
 
-        result.paste(blurred, (x1, y1))
+        image.paste(blurred, bbox[:2])
 
-        logger.debug(f"已应用高斯模糊: bbox={bbox}")
-        return result
+        logger.debug("已应用高斯模糊: bbox={}", bbox)
 
 
 class SolidFillOperator(MosaicOperator):
@@ -209,36 +243,49 @@ class SolidFillOperator(MosaicOperator):
         self._fill_color = fill_color
         logger.debug(f"纯色填充操作符初始化: fill_color={fill_color}")
 
-    def apply(
+    def apply_all(
         self,
         image: Image.Image,
-        bbox: tuple[int, int, int, int],
+        bboxes: Iterable[tuple[int, int, int, int]],
     ) -> Image.Image:
         """
-        应用纯色填充
+        对图像的多个区域应用纯色填充
+
+        所有区域共用同一个绘图对象，在一次图像复制上依次绘制。
 
         Args:
             image: PIL图像对象
-            bbox: 边界框 (left, top, right, bottom)
+            bboxes: 边界框列表，每个元素为 (left, top, right, bottom)
 
         Returns:
             处理后的图像
         """
         result = image.copy()
-        x1, y1, x2, y2 = bbox
+        draw = ImageDraw.Draw(result)
+        count = 0
+        for bbox in self._valid_bboxes(bboxes):
+            draw.rectangle(bbox, fill=self._fill_color)
+            count += 1
 
-        width = x2 - x1
-        height = y2 - y1
+        logger.debug("已应用纯色填充: {} 个区域, color={}", count, self._fill_color)
+        return result
 
-        if width <= 0 or height <= 0:
-            logger.warning(f"无效的边界框: {bbox}")
-            return result
+    def _apply_region(
+        self,
+        image: Image.Image,
+        bbox: tuple[int, int, int, int],
+    ) -> None:
+        """
+        应用纯色填充
 
-        draw = ImageDraw.Draw(result)
-        draw.rectangle((x1, y1, x2, y2), fill=self._fill_color)
+        Args:
+            image: PIL图像对象（将被修改）
+            bbox: 边界框 (left, top, right, bottom)
+        """
+        draw = ImageDraw.Draw(image)
+        draw.rectangle(bbox, fill=self._fill_color)
 
-        logger.debug(f"已应用纯色填充: bbox={bbox}, color={self._fill_color}")
-        return result
+        logger.debug("已应用纯色填充: bbox={}, color={}", bbox, self._fill_color)
 
 
 def create_mosaic_operator(
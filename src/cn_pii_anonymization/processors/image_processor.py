@@ -306,10 +306,8 @@ class ImageProcessor:
         Returns:
             PII实体列表
         """
-        self._redactor.redact(
-            image=image,
-            mosaic_style=MosaicStyle.FILL,
-            fill_color=(0, 0, 0),
+        self._redactor.analyze(
+            image,
             entities=entities,
             allow_list=allow_list,
             score_threshold=score_threshold,
@@ -368,7 +366,7 @@ class ImageProcessor:
         if ext not in settings.supported_image_formats:
             raise UnsupportedImageFormatError(
                 f"不支持的图像格式: {ext}。"
-                f"支持的格式: {', '.join(settings.supported_image_formats)}"
+                f"支持的格式: {', '.join(sorted(settings.supported_image_formats))}"
             )
 
     def _validate_image_size(self, image_bytes: bytes) -> None:
@@ -43,6 +43,9 @@ class CNBankCardRecognizer(CNPIIRecognizer):
         r"(?<![a-zA-Z\d])\d(?:\s*\d){15,18}(?![a-zA-Z\d])"
     )
 
+    # Luhn算法中偶数位数字加倍后的取值（加倍结果大于9时减9）
+    LUHN_DOUBLED: ClassVar[tuple[int, ...]] = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
     CONTEXT_WORDS: ClassVar[list[str]] = [
         "银行卡",
         "卡号",
@@ -146,8 +149,8 @@ class CNBankCardRecognizer(CNPIIRecognizer):
 
         return self._luhn_check(card_number)
 
-    @staticmethod
-    def _luhn_check(card_number: str) -> bool:
+    @classmethod
+    def _luhn_check(cls, card_number: str) -> bool:
         """
         Luhn算法校验
 
@@ -157,15 +160,9 @@ class CNBankCardRecognizer(CNPIIRecognizer):
         Returns:
             是否通过Luhn校验
         """
-        digits = [int(d) for d in card_number]
-        odd_digits = digits[-1::-2]
-        even_digits = digits[-2::-2]
-
-        total = sum(odd_digits)
-        for d in even_digits:
-            doubled = d * 2
-            total += doubled if doubled < 10 else doubled - 9
-
+        digits = list(map(int, card_number))
+        doubled = cls.LUHN_DOUBLED
+        total = sum(digits[-1::-2]) + sum([doubled[d] for d in digits[-2::-2]])
         return total % 10 == 0
 
     def _calculate_score(self, card_number: str) -> float:
@@ -6,6 +6,7 @@
 
 import re
 from datetime import datetime
+from operator import mul
 from typing import Any, ClassVar
 
 from presidio_analyzer import RecognizerResult
@@ -50,6 +51,10 @@ class CNIDCardRecognizer(CNPIIRecognizer):
         r"(?<![a-zA-Z\d])[1-9](?:\s*\d){18}(?![a-zA-Z\d])"
     )
 
+    # GB 11643-1999 校验码加权因子及校验码对照表
+    CHECK_WEIGHTS: ClassVar[tuple[int, ...]] = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+    CHECK_CODES: ClassVar[str] = "10X98765432"
+
     CONTEXT_WORDS: ClassVar[list[str]] = [
         "身份证",
         "身份证号",
@@ -270,8 +275,8 @@ class CNIDCardRecognizer(CNPIIRecognizer):
         except ValueError:
             return False
 
-    @staticmethod
-    def _validate_check_digit(id_card: str) -> bool:
+    @classmethod
+    def _validate_check_digit(cls, id_card: str) -> bool:
         """
         验证校验码
 
@@ -283,10 +288,7 @@ class CNIDCardRecognizer(CNPIIRecognizer):
         Returns:
             校验码是否正确
         """
-        weights = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-        check_codes = "10X98765432"
-
-        total = sum(int(id_card[i]) * weights[i] for i in range(17))
+        total = sum(map(mul, map(int, id_card[:17]), cls.CHECK_WEIGHTS))
 
-        expected_check = check_codes[total % 11]
+        expected_check = cls.CHECK_CODES[total % 11]
         return id_card[17].upper() == expected_check
@@ -4,6 +4,7 @@
 支持自定义allow_list和deny_list配置。
 """
 
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
 from presidio_analyzer import RecognizerResult
@@ -88,8 +89,8 @@ class CNNameRecognizer(CNPIIRecognizer):
     def __init__(
         self,
         ie_engine: Any = None,
-        allow_list: list[str] | None = None,
-        deny_list: list[str] | None = None,
+        allow_list: Iterable[str] | None = None,
+        deny_list: Iterable[str] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -56,6 +56,11 @@ class CNPassportRecognizer(CNPIIRecognizer):
         ),
     ]
 
+    # 完整护照号格式校验：新版、旧版、港澳通行证
+    VALID_PASSPORT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"[EG][A-Z]\d{8}|[A-Z]{1,2}\d{6,10}|[CH]\d{8,10}"
+    )
+
     CONTEXT_WORDS: ClassVar[list[str]] = [
         "护照",
         "护照号",
@@ -133,8 +138,8 @@ class CNPassportRecognizer(CNPIIRecognizer):
                 logger.debug(f"无效护照号被过滤: {passport}")
         return valid_results
 
-    @staticmethod
-    def _is_valid_passport(passport: str) -> bool:
+    @classmethod
+    def _is_valid_passport(cls, passport: str) -> bool:
         """
         校验护照号格式
 
@@ -150,13 +155,4 @@ class CNPassportRecognizer(CNPIIRecognizer):
         if len(passport) < 6 or len(passport) > 15:
             return False
 
-        new_passport_pattern = re.compile(r"^[EG][A-Z]\d{8}$")
-        if new_passport_pattern.match(passport):
-            return True
-
-        old_passport_pattern = re.compile(r"^[A-Z]{1,2}\d{6,10}$")
-        if old_passport_pattern.match(passport):
-            return True
-
-        hk_macao_pattern = re.compile(r"^[CH]\d{8,10}$")
-        return bool(hk_macao_pattern.match(passport))
+        return cls.VALID_PASSPORT_PATTERN.fullmatch(passport) is not None
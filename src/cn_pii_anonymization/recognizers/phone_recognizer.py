@@ -54,6 +54,16 @@ class CNPhoneRecognizer(CNPIIRecognizer):
         ),
     ]
 
+    # 匹配模式在类定义时编译一次，所有实例共享
+    _compiled_patterns: ClassVar[tuple[tuple[str, re.Pattern[str], float], ...]] = tuple(
+        (pattern.name, re.compile(pattern.regex), pattern.score) for pattern in PATTERNS
+    )
+
+    # 校验时用于清理分隔符和国际区号的正则
+    SEPARATOR_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[\s\-\+]")
+    COUNTRY_CODE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^86")
+    INTL_PREFIX_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^0086")
+
     CONTEXT_WORDS: ClassVar[list[str]] = [
         "手机",
         "电话",
@@ -82,9 +92,6 @@ class CNPhoneRecognizer(CNPIIRecognizer):
             context=self.CONTEXT_WORDS,
             **kwargs,
         )
-        self._compiled_patterns = [
-            (pattern.name, re.compile(pattern.regex), pattern.score) for pattern in self.PATTERNS
-        ]
 
     def analyze(
         self,
@@ -163,8 +170,8 @@ class CNPhoneRecognizer(CNPIIRecognizer):
 
         return merged
 
-    @staticmethod
-    def _is_valid_phone(phone: str) -> bool:
+    @classmethod
+    def _is_valid_phone(cls, phone: str) -> bool:
         """
         校验手机号格式
 
@@ -174,9 +181,9 @@ class CNPhoneRecognizer(CNPIIRecognizer):
         Returns:
             是否为有效的手机号
         """
-        clean_phone = re.sub(r"[\s\-\+]", "", phone)
-        clean_phone = re.sub(r"^86", "", clean_phone)
-        clean_phone = re.sub(r"^0086", "", clean_phone)
+        clean_phone = cls.SEPARATOR_PATTERN.sub("", phone)
+        clean_phone = cls.COUNTRY_CODE_PATTERN.sub("", clean_phone)
+        clean_phone = cls.INTL_PREFIX_PATTERN.sub("", clean_phone)
 
         if len(clean_phone) != 11:
             return False
@@ -10,6 +10,8 @@ from loguru import logger
 
 from cn_pii_anonymization.config.settings import settings
 
+_logging_configured = False
+
 
 def setup_logging() -> None:
     """
@@ -17,14 +19,21 @@ def setup_logging() -> None:
 
     移除默认处理器，添加控制台和文件处理器。
     如果 DEBUG=true，自动使用 DEBUG 日志级别。
+    两个处理器均启用enqueue，日志写入由后台线程完成，不阻塞调用方。
+    日志格式包含当前请求的request_id，便于关联同一请求的日志。
     """
+    global _logging_configured
+
     logger.remove()
+    # 请求内的日志由LoggingMiddleware通过contextualize注入request_id，请求外使用默认值
+    logger.configure(extra={"request_id": "-"})
 
     log_level = "DEBUG" if settings.debug else settings.log_level
 
     log_format = (
         "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
         "<level>{level: <8}</level> | "
+        "{extra[request_id]} | "
         "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
         "<level>{message}</level>"
     )
@@ -42,7 +51,10 @@ def setup_logging() -> None:
 
     logger.add(
         str(log_path),
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+        format=(
+            "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {extra[request_id]} | "
+            "{name}:{function}:{line} | {message}"
+        ),
         level=log_level,
         rotation="10 MB",
         retention="7 days",
@@ -51,9 +63,21 @@ def setup_logging() -> None:
         enqueue=True,
     )
 
+    _logging_configured = True
     logger.info(f"日志系统初始化完成，日志级别: {log_level}")
 
 
+def ensure_logging() -> None:
+    """
+    确保日志系统已配置
+
+    由uvicorn多进程或直接以应用路径启动时，工作进程不会执行入口脚本中的
+    setup_logging()，此时补充配置，避免日志同步写入默认的stderr处理器。
+    """
+    if not _logging_configured:
+        setup_logging()
+
+
 def get_logger(name: str = __name__):
     """
     获取带有模块名称的logger实例
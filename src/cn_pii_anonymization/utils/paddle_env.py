@@ -0,0 +1,30 @@
+"""
+Paddle运行环境变量模块
+
+集中维护Paddle相关的环境变量。Paddle仅在首次导入时读取这些变量，
+导入本模块即会设置，因此需要在导入paddle、paddlenlp或paddleocr之前导入本模块：
+
+    import cn_pii_anonymization.utils.paddle_env  # noqa: F401
+"""
+
+import os
+
+# 关闭MKLDNN/oneDNN与PIR，模型从BOS源下载
+PADDLE_ENV_FLAGS: dict[str, str] = {
+    "FLAGS_use_mkldnn": "0",
+    "FLAGS_enable_onednn_backend": "0",
+    "FLAGS_disable_onednn_backend": "1",
+    "FLAGS_enable_pir_api": "0",
+    "FLAGS_json_format_model": "0",
+    "PADDLE_PDX_USE_PIR_TRT": "0",
+    "PADDLE_PDX_ENABLE_MKLDNN_BYDEFAULT": "0",
+    "PADDLE_PDX_MODEL_SOURCE": "bos",
+}
+
+
+def apply_paddle_env() -> None:
+    """设置Paddle环境变量"""
+    os.environ.update(PADDLE_ENV_FLAGS)
+
+
+apply_paddle_env()
@@ -252,6 +252,21 @@ class TestImageAnonymizeEndpoint:
 
         assert response.status_code == 400
 
+    def test_anonymize_image_invalid_mosaic_style(
+        self,
+        client: TestClient,
+        sample_image_bytes: bytes,
+    ) -> None:
+        """测试无效马赛克样式"""
+        files = {"image": ("test.png", sample_image_bytes, "image/png")}
+        response = client.post(
+            "/api/v1/image/anonymize",
+            files=files,
+            data={"mosaic_style": "unknown"},
+        )
+
+        assert response.status_code == 400
+
     def test_anonymize_image_invalid_format(self, client: TestClient) -> None:
         """测试无效图像格式"""
         files = {"image": ("test.txt", b"not an image", "text/plain")}
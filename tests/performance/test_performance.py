@@ -79,13 +79,12 @@ class TestPerformance:
     def test_multiple_iterations(self, analyzer, sample_text):
         """测试多次迭代性能"""
         iterations = 100
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         for _ in range(iterations):
             analyzer.analyze(sample_text)
 
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         avg_time = total_time / iterations
 
         print(f"\n总时间: {total_time:.3f}s")
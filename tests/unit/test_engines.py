@@ -5,11 +5,17 @@
 """
 
 import pytest
+from PIL import Image
+from presidio_analyzer import Pattern, PatternRecognizer
 from presidio_analyzer.recognizer_result import RecognizerResult
+from presidio_anonymizer.entities import OperatorConfig
 
 from cn_pii_anonymization.config.settings import PIIPrioritySettings, settings
 from cn_pii_anonymization.core.analyzer import CNPIIAnalyzerEngine
 from cn_pii_anonymization.core.anonymizer import CNPIIAnonymizerEngine
+from cn_pii_anonymization.core.image_redactor import CNPIIImageRedactorEngine
+from cn_pii_anonymization.nlp import IEResultDiskCache, PaddleNLPInfoExtractionEngine
+from cn_pii_anonymization.ocr.ocr_engine import OCRResult
 
 
 class TestCNPIIAnalyzerEngine:
@@ -74,6 +80,140 @@ class TestCNPIIAnalyzerEngine:
 
         assert len(results) == 0
 
+    def test_analyze_result_cache(self, analyzer):
+        """测试重复文本命中缓存，返回结果副本"""
+        analyzer.clear_cache()
+        text = "手机号13812345678"
+        first = analyzer.analyze(text, entities=["CN_PHONE_NUMBER"])
+        second = analyzer.analyze(text, entities=["CN_PHONE_NUMBER"])
+
+        assert len(analyzer._result_cache) == 1
+        assert [(r.entity_type, r.start, r.end) for r in first] == [
+            (r.entity_type, r.start, r.end) for r in second
+        ]
+        assert first[0] is not second[0]
+
+        analyzer.clear_cache()
+        assert len(analyzer._result_cache) == 0
+
+    def test_analyze_batch(self, analyzer):
+        """测试批量分析：重复文本只返回一项，结果顺序与输入一致"""
+        texts = ["手机号13812345678", "普通文本", "手机号13812345678", ""]
+        results = analyzer.analyze_batch(texts, entities=["CN_PHONE_NUMBER"])
+
+        assert list(results) == ["手机号13812345678", "普通文本", ""]
+        assert any(r.entity_type == "CN_PHONE_NUMBER" for r in results["手机号13812345678"])
+        assert results["普通文本"] == []
+        assert results[""] == []
+
+    def test_analyze_batch_shares_result_cache(self, analyzer):
+        """测试批量分析结果写入分析缓存，与单文本分析共用"""
+        analyzer.clear_cache()
+        text = "手机号13812345678"
+        batch_results = analyzer.analyze_batch([text], entities=["CN_PHONE_NUMBER"])
+        assert len(analyzer._result_cache) == 1
+
+        results = analyzer.analyze(text, entities=["CN_PHONE_NUMBER"])
+        assert [(r.entity_type, r.start, r.end) for r in results] == [
+            (r.entity_type, r.start, r.end) for r in batch_results[text]
+        ]
+        assert len(analyzer._result_cache) == 1
+
+    def test_analyze_batch_with_workers(self, analyzer, monkeypatch):
+        """测试多线程批量分析与串行结果一致"""
+        texts = ["手机号13812345678", "身份证110101199001011234", "普通文本"]
+        serial = analyzer.analyze_batch(texts, entities=["CN_PHONE_NUMBER", "CN_ID_CARD"])
+
+        monkeypatch.setattr(settings, "analyze_batch_workers", 2)
+        threaded = analyzer.analyze_batch(texts, entities=["CN_PHONE_NUMBER", "CN_ID_CARD"])
+
+        assert list(threaded) == list(serial)
+        for text in texts:
+            assert [(r.entity_type, r.start, r.end) for r in threaded[text]] == [
+                (r.entity_type, r.start, r.end) for r in serial[text]
+            ]
+
+    def test_analyze_batch_tokenizes_once(self, analyzer, monkeypatch):
+        """测试批量分析只调用一次批量分词，不再逐文本分词"""
+        analyzer.clear_cache()
+        nlp_engine = analyzer._nlp_engine
+        batch_calls = []
+        process_batch = nlp_engine.process_batch
+
+        def counting_process_batch(texts, *args, **kwargs):
+            batch_calls.append(list(texts))
+            return process_batch(texts, *args, **kwargs)
+
+        def fail_process_text(*args, **kwargs):
+            raise AssertionError("批量分析不应逐文本分词")
+
+        monkeypatch.setattr(nlp_engine, "process_batch", counting_process_batch)
+        monkeypatch.setattr(nlp_engine, "process_text", fail_process_text)
+
+        texts = ["手机号13812345678", "身份证110101199001011237", "手机号13812345678"]
+        results = analyzer.analyze_batch(texts, entities=["CN_PHONE_NUMBER", "CN_ID_CARD"])
+
+        assert batch_calls == [["手机号13812345678", "身份证110101199001011237"]]
+        assert results["手机号13812345678"][0].entity_type == "CN_PHONE_NUMBER"
+        assert results["身份证110101199001011237"][0].entity_type == "CN_ID_CARD"
+
+    def test_regex_candidate_prefilter(self):
+        """测试正则类PII候选预过滤"""
+        assert CNPIIAnalyzerEngine._may_contain_regex_pii("手机号13812345678")
+        assert CNPIIAnalyzerEngine._may_contain_regex_pii("邮箱a@b")
+        assert not CNPIIAnalyzerEngine._may_contain_regex_pii("这是一段普通的中文文本")
+
+    def test_unmatchable_regex_entities(self):
+        """测试按数字个数和"@"排除不可能命中的正则类实体"""
+        unmatchable = CNPIIAnalyzerEngine._unmatchable_regex_entities
+        assert unmatchable("普通文本") == CNPIIAnalyzerEngine.REGEX_ENTITIES
+        assert unmatchable("手机号13812345678") == {"CN_ID_CARD", "CN_BANK_CARD", "CN_EMAIL"}
+        assert unmatchable("身份证110101199003077777") == {"CN_EMAIL"}
+        assert unmatchable("邮箱a@b.com") == {
+            "CN_ID_CARD",
+            "CN_BANK_CARD",
+            "CN_PHONE_NUMBER",
+            "CN_PASSPORT",
+        }
+
+    def test_score_threshold_filtering(self, analyzer):
+        """测试置信度阈值过滤"""
+        default = settings.score_thresholds.default
+        assert CNPIIAnalyzerEngine._presidio_threshold(None) == default
+        assert CNPIIAnalyzerEngine._presidio_threshold(0.0) == default
+        assert CNPIIAnalyzerEngine._presidio_threshold(0.9) == 0.9
+
+        results = [
+            RecognizerResult(entity_type="CN_PHONE_NUMBER", start=0, end=11, score=0.4),
+            RecognizerResult(entity_type="CN_EMAIL", start=12, end=20, score=0.9),
+        ]
+        filtered = analyzer._apply_priority_filter(results, settings.score_thresholds)
+        assert [r.entity_type for r in filtered] == ["CN_EMAIL"]
+        assert len(analyzer._apply_priority_filter(results)) == 2
+
+    def test_threshold_filter_before_priority(self, analyzer):
+        """测试低于阈值的结果不参与优先级比较"""
+        results = [
+            RecognizerResult(entity_type="CN_ID_CARD", start=0, end=18, score=0.1),
+            RecognizerResult(entity_type="CN_PHONE_NUMBER", start=3, end=14, score=1.0),
+        ]
+        filtered = analyzer._apply_priority_filter(results, settings.score_thresholds)
+        assert [r.entity_type for r in filtered] == ["CN_PHONE_NUMBER"]
+
+    def test_analyze_regex_entities_without_digits(self, analyzer):
+        """测试不含数字的文本直接跳过正则类识别"""
+        results = analyzer.analyze("这是一段普通的中文文本", entities=["CN_PHONE_NUMBER"])
+        assert results == []
+
+    def test_refresh_settings(self, analyzer):
+        """测试refresh_settings重新绑定刷新后的配置对象"""
+        settings.refresh()
+        assert analyzer._thresholds is not settings.score_thresholds
+
+        analyzer.refresh_settings()
+        assert analyzer._thresholds is settings.score_thresholds
+        assert analyzer._priorities is settings.pii_priorities
+
     def test_singleton_pattern(self, analyzer):
         """测试单例模式"""
         analyzer2 = CNPIIAnalyzerEngine()
@@ -86,6 +226,53 @@ class TestCNPIIAnalyzerEngine:
         assert new_analyzer is not analyzer
         CNPIIAnalyzerEngine.reset()
 
+    def test_lazy_initialization(self):
+        """测试引擎组件在首次使用时才创建"""
+        CNPIIAnalyzerEngine.reset()
+        engine = CNPIIAnalyzerEngine()
+        assert not engine._ready
+
+        assert "CN_PHONE_NUMBER" in engine.get_supported_entities()
+        assert engine._ready
+        CNPIIAnalyzerEngine.reset()
+
+    def test_custom_recognizer_bypasses_regex_prefilter(self):
+        """测试自定义识别器的实体类型不受内置识别器位数预过滤影响"""
+        CNPIIAnalyzerEngine.reset()
+        engine = CNPIIAnalyzerEngine()
+        landline = PatternRecognizer(
+            supported_entity="CN_PHONE_NUMBER",
+            patterns=[Pattern(name="landline", regex=r"\d{4}-\d{4}", score=0.9)],
+            supported_language="zh",
+        )
+        engine.add_recognizer(landline)
+
+        text = "座机8765-4321"
+        for results in (
+            engine.analyze(text, entities=["CN_PHONE_NUMBER"]),
+            engine.analyze_batch([text], entities=["CN_PHONE_NUMBER"])[text],
+        ):
+            assert [(r.entity_type, r.start, r.end) for r in results] == [
+                ("CN_PHONE_NUMBER", 2, 11)
+            ]
+        CNPIIAnalyzerEngine.reset()
+
+    def test_regex_recognizers_shared_across_reset(self):
+        """测试重置后重建注册表时复用正则类识别器实例"""
+        CNPIIAnalyzerEngine.reset()
+        first = CNPIIAnalyzerEngine()
+        first._ensure_ready()
+        first_phone = first._registry.get_recognizers("zh", ["CN_PHONE_NUMBER"])[0]
+
+        CNPIIAnalyzerEngine.reset()
+        second = CNPIIAnalyzerEngine()
+        second._ensure_ready()
+        second_phone = second._registry.get_recognizers("zh", ["CN_PHONE_NUMBER"])[0]
+
+        assert first is not second
+        assert first_phone is second_phone
+        CNPIIAnalyzerEngine.reset()
+
 
 class TestCNPIIAnonymizerEngine:
     """匿名化引擎测试类"""
@@ -142,6 +329,22 @@ class TestCNPIIAnonymizerEngine:
 
         assert result.text == text
 
+    def test_anonymize_override_keeps_defaults(self, anonymizer, analyzer):
+        """测试自定义操作符只作用于本次调用，不修改默认操作符"""
+        text = "我的手机号是13812345678"
+        analyzer_results = analyzer.analyze(text, entities=["CN_PHONE_NUMBER"])
+        default_operators = dict(anonymizer._operators)
+
+        result = anonymizer.anonymize(
+            text,
+            analyzer_results,
+            operators={"CN_PHONE_NUMBER": OperatorConfig("replace", {"new_value": "<PHONE>"})},
+        )
+
+        assert "<PHONE>" in result.text
+        assert dict(anonymizer._operators) == default_operators
+        assert "138****5678" in anonymizer.anonymize(text, analyzer_results).text
+
     def test_singleton_pattern(self, anonymizer):
         """测试单例模式"""
         anonymizer2 = CNPIIAnonymizerEngine()
@@ -279,27 +482,24 @@ class TestPIIPriorityFilter:
         assert "CN_PHONE_NUMBER" in entity_types
         assert "CN_ID_CARD" in entity_types
 
-    def test_results_overlap_method(self):
-        """测试重叠检测方法"""
-        # 完全重叠
-        r1 = RecognizerResult(entity_type="CN_ID_CARD", start=0, end=18, score=0.95)
-        r2 = RecognizerResult(entity_type="CN_PHONE_NUMBER", start=0, end=11, score=0.85)
-        assert CNPIIAnalyzerEngine._results_overlap(r1, r2)
-
-        # 部分重叠
-        r3 = RecognizerResult(entity_type="CN_ID_CARD", start=0, end=18, score=0.95)
-        r4 = RecognizerResult(entity_type="CN_PHONE_NUMBER", start=10, end=21, score=0.85)
-        assert CNPIIAnalyzerEngine._results_overlap(r3, r4)
-
-        # 不重叠
-        r5 = RecognizerResult(entity_type="CN_PHONE_NUMBER", start=0, end=11, score=0.85)
-        r6 = RecognizerResult(entity_type="CN_ID_CARD", start=20, end=38, score=0.95)
-        assert not CNPIIAnalyzerEngine._results_overlap(r5, r6)
+    def test_priority_filter_overlap_boundaries(self, analyzer):
+        """测试优先级过滤的重叠判定：部分重叠时保留高优先级结果，相邻结果均保留"""
+        partial = [
+            RecognizerResult(entity_type="CN_ID_CARD", start=0, end=18, score=0.95),
+            RecognizerResult(entity_type="CN_PHONE_NUMBER", start=10, end=21, score=0.85),
+        ]
+        assert [r.entity_type for r in analyzer._apply_priority_filter(partial)] == [
+            "CN_ID_CARD"
+        ]
 
-        # 相邻不重叠
-        r7 = RecognizerResult(entity_type="CN_PHONE_NUMBER", start=0, end=11, score=0.85)
-        r8 = RecognizerResult(entity_type="CN_ID_CARD", start=11, end=29, score=0.95)
-        assert not CNPIIAnalyzerEngine._results_overlap(r7, r8)
+        adjacent = [
+            RecognizerResult(entity_type="CN_PHONE_NUMBER", start=0, end=11, score=0.85),
+            RecognizerResult(entity_type="CN_ID_CARD", start=11, end=29, score=0.95),
+        ]
+        assert [r.entity_type for r in analyzer._apply_priority_filter(adjacent)] == [
+            "CN_PHONE_NUMBER",
+            "CN_ID_CARD",
+        ]
 
     def test_priority_settings(self):
         """测试优先级配置"""
@@ -402,3 +602,200 @@ class TestPIIPriorityFilter:
         assert filtered[0].entity_type == "CN_PHONE_NUMBER"
 
         CNPIIAnalyzerEngine.reset()
+
+
+class TestImageRedactorBboxMerge:
+    """图像脱敏引擎边界框合并测试类"""
+
+    @pytest.fixture
+    def redactor(self):
+        """创建未初始化OCR的图像脱敏实例（边界框合并不依赖OCR）"""
+        engine = CNPIIImageRedactorEngine.__new__(CNPIIImageRedactorEngine)
+        yield engine
+        CNPIIImageRedactorEngine.reset()
+
+    def test_merge_empty(self, redactor):
+        """测试空列表"""
+        assert redactor._merge_overlapping_bboxes([]) == []
+
+    def test_merge_overlapping(self, redactor):
+        """测试重叠框合并"""
+        bboxes = [
+            ("CN_NAME", "张三", 0, 0, 10, 10, 0.9),
+            ("CN_PHONE_NUMBER", "13812345678", 8, 2, 10, 10, 1.0),
+        ]
+        assert redactor._merge_overlapping_bboxes(bboxes, padding=0) == [(0, 0, 18, 12)]
+
+    def test_merge_separate(self, redactor):
+        """测试不重叠框保持独立并按位置排序"""
+        bboxes = [
+            ("CN_NAME", "张三", 100, 50, 10, 10, 0.9),
+            ("CN_NAME", "李四", 0, 0, 10, 10, 0.9),
+        ]
+        assert redactor._merge_overlapping_bboxes(bboxes, padding=0) == [
+            (0, 0, 10, 10),
+            (100, 50, 110, 60),
+        ]
+
+    def test_merge_chained(self, redactor):
+        """测试合并后的框与其他框产生新的重叠时继续合并"""
+        bboxes = [
+            ("CN_NAME", "a", 0, 0, 10, 10, 0.9),
+            ("CN_NAME", "b", 20, 0, 10, 10, 0.9),
+            ("CN_NAME", "c", 5, 5, 20, 2, 0.9),
+        ]
+        assert redactor._merge_overlapping_bboxes(bboxes, padding=0) == [(0, 0, 30, 10)]
+
+    def test_merge_covers_box_overlapping_only_merged_bounds(self, redactor):
+        """测试合并后的外接框覆盖到与任一原始框都不重叠的框时也会合并"""
+        bboxes = [
+            ("CN_NAME", "a", 0, 0, 10, 10, 0.9),
+            ("CN_NAME", "b", 8, 8, 10, 10, 0.9),
+            ("CN_NAME", "c", 15, 0, 3, 3, 0.9),
+        ]
+        assert redactor._merge_overlapping_bboxes(bboxes, padding=0) == [(0, 0, 18, 18)]
+
+    def test_merge_reaches_box_left_behind_by_sweep(self, redactor):
+        """测试合并后的框向左覆盖到扫描中已越过的框时也会合并"""
+        bboxes = [
+            ("CN_ADDRESS", "a", 0, 0, 100, 10, 0.9),
+            ("CN_NAME", "r", 10, 50, 10, 10, 0.9),
+            ("CN_NAME", "c", 50, 5, 10, 50, 0.9),
+        ]
+        assert redactor._merge_overlapping_bboxes(bboxes, padding=0) == [(0, 0, 100, 60)]
+
+    def test_merge_adjacent_text_boxes_first_matching_line(self, redactor):
+        """测试文本框归入首个垂直位置相近的行，同行相邻框按水平位置拼接"""
+        boxes = [
+            ("张三", 0, 0, 20, 10),
+            ("地址", 0, 8, 20, 10),
+            ("电话", 25, 4, 20, 10),
+            ("北京", 200, 8, 20, 10),
+        ]
+        assert redactor._merge_adjacent_text_boxes(boxes) == [
+            ("张三电话", 0, 0, 45, 10),
+            ("地址", 0, 8, 20, 10),
+            ("北京", 200, 8, 20, 10),
+        ]
+
+    def test_merge_adjacent_text_boxes_vertical_window_inclusive(self, redactor):
+        """测试垂直位置差恰好等于阈值的框归入同一行，超出阈值的另起一行"""
+        boxes = [
+            ("a", 0, 10, 10, 10),
+            ("b", 12, 5, 10, 10),
+            ("c", 24, 15, 10, 10),
+            ("d", 0, 16, 10, 10),
+            ("e", 0, 4, 10, 10),
+        ]
+        assert redactor._merge_adjacent_text_boxes(boxes, max_vertical_diff=5) == [
+            ("abc", 0, 10, 34, 10),
+            ("d", 0, 16, 10, 10),
+            ("e", 0, 4, 10, 10),
+        ]
+
+    def test_analyze_ocr_result_single_batch_call(self, redactor):
+        """测试文本框通过一次批量分析完成，跳过白名单与纯符号文本，相同文本的每个位置都生成边界框"""
+        calls = []
+
+        class _BatchAnalyzer:
+            def analyze_batch(self, texts, entities=None, score_threshold=None):
+                calls.append(list(texts))
+                return {
+                    text: [RecognizerResult("CN_PHONE_NUMBER", 0, len(text), 1.0)]
+                    for text in texts
+                    if text.isdigit()
+                }
+
+        redactor._analyzer = _BatchAnalyzer()
+        ocr_result = OCRResult(
+            text="",
+            bounding_boxes=[
+                ("13812345678", 0, 0, 50, 10),
+                ("姓名", 0, 40, 20, 10),
+                ("13812345678", 0, 80, 50, 10),
+                ("白名单", 0, 120, 30, 10),
+                ("：——", 0, 160, 30, 10),
+            ],
+        )
+
+        bboxes = redactor._analyze_ocr_result(ocr_result, None, ["白名单"], None)
+
+        assert calls == [["13812345678", "姓名"]]
+        assert bboxes == [
+            ("CN_PHONE_NUMBER", "13812345678", 0, 0, 50, 10, 1.0),
+            ("CN_PHONE_NUMBER", "13812345678", 0, 80, 50, 10, 1.0),
+        ]
+
+    def test_analyze_refreshes_cached_bboxes(self, redactor):
+        """测试仅分析图像时缓存本次PII边界框，无文本框的图像会清空上一次的结果"""
+        ocr_results = [
+            OCRResult(text="13812345678", bounding_boxes=[("13812345678", 0, 0, 50, 10)]),
+            OCRResult(text="", bounding_boxes=[]),
+        ]
+
+        class _OCREngine:
+            def is_available(self):
+                return True
+
+            def recognize(self, image):
+                return ocr_results.pop(0)
+
+        class _BatchAnalyzer:
+            def analyze_batch(self, texts, entities=None, score_threshold=None):
+                return {
+                    text: [RecognizerResult("CN_PHONE_NUMBER", 0, len(text), 1.0)] for text in texts
+                }
+
+        redactor._ocr_engine = _OCREngine()
+        redactor._analyzer = _BatchAnalyzer()
+        image = Image.new("RGB", (100, 100))
+
+        bboxes = redactor.analyze(image)
+        assert bboxes == [("CN_PHONE_NUMBER", "13812345678", 0, 0, 50, 10, 1.0)]
+        assert redactor.get_pii_bboxes() == bboxes
+
+        assert redactor.analyze(image) == []
+        assert redactor.get_pii_bboxes() == []
+
+
+class TestIEResultDiskCache:
+    """信息抽取结果磁盘缓存测试类"""
+
+    def test_cache_roundtrip(self, tmp_path):
+        """测试结果写入后可读回，schema不同则不命中"""
+        cache = IEResultDiskCache(tmp_path / "ie_cache.sqlite3")
+        results = {"张三住在北京": [{"姓名": [{"text": "张三", "probability": 0.9}]}]}
+        cache.set_many(results, schema=["姓名"])
+
+        assert cache.get_many(["张三住在北京", "无关文本"], schema=["姓名"]) == results
+        assert cache.get_many(["张三住在北京"], schema=["地址"]) == {}
+        cache.close()
+
+    def test_cache_evicts_oldest(self, tmp_path):
+        """测试超过上限时淘汰最早写入的记录"""
+        cache = IEResultDiskCache(tmp_path / "ie_cache.sqlite3", max_entries=2)
+        for text in ("a", "b", "c"):
+            cache.set_many({text: []}, schema=["姓名"])
+
+        assert set(cache.get_many(["a", "b", "c"], schema=["姓名"])) == {"b", "c"}
+        cache.close()
+
+    def test_extract_batch_skips_cached_texts(self, tmp_path):
+        """测试批量抽取只将未命中缓存的文本送入模型"""
+        cache = IEResultDiskCache(tmp_path / "ie_cache.sqlite3")
+        engine = PaddleNLPInfoExtractionEngine(schema=["姓名"], cache=cache)
+        calls = []
+
+        def fake_ie(texts):
+            calls.append(list(texts))
+            return [{"姓名": [{"text": text[:2], "probability": 0.9}]} for text in texts]
+
+        engine._ie_engine = fake_ie
+        engine._initialized = True
+
+        first = engine.extract_batch(["张三你好", "李四你好"])
+        second = engine.extract_batch(["张三你好", "王五你好"])
+
+        assert calls == [["张三你好", "李四你好"], ["王五你好"]]
+        assert second["张三你好"] == first["张三你好"]
+        cache.close()
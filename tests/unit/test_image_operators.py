@@ -118,6 +118,16 @@ class TestSolidFillOperator:
         pixel = result.getpixel((30, 30))
         assert pixel == (0, 0, 0)
 
+    def test_apply_all(self, operator: SolidFillOperator, sample_image: Image.Image) -> None:
+        """测试一次处理多个区域，原图不被修改，无效边界框被跳过"""
+        bboxes = [(10, 10, 20, 20), (60, 60, 70, 70), (50, 50, 40, 40)]
+        result = operator.apply_all(sample_image, bboxes)
+
+        assert result.getpixel((15, 15)) == (0, 0, 0)
+        assert result.getpixel((65, 65)) == (0, 0, 0)
+        assert result.getpixel((45, 45)) == (255, 255, 255)
+        assert sample_image.getpixel((15, 15)) == (255, 255, 255)
+
 
 class TestCreateMosaicOperator:
     """马赛克操作符工厂函数测试"""
@@ -88,6 +88,10 @@ class TestCNFakeOperator:
         assert len(phone) == 11
         assert phone.startswith("1")
 
+    def test_faker_shared_between_instances(self):
+        """测试Faker实例按locale在操作符之间共享"""
+        assert CNFakeOperator()._faker is CNFakeOperator()._faker
+
     def test_id_card_format(self, operator):
         """测试身份证格式"""
         id_card = operator.operate("110101199001011234", {"entity_type": "CN_ID_CARD"})
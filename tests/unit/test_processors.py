@@ -2,6 +2,9 @@
 处理器单元测试
 """
 
+from cn_pii_anonymization.api.schemas.response import ImagePIIEntityResponse
+from cn_pii_anonymization.processors.image_processor import ImagePIIEntity
+
 
 class TestTextProcessor:
     """文本处理器测试类"""
@@ -75,3 +78,20 @@ class TestTextProcessor:
         assert "CN_BANK_CARD" in entities
         assert "CN_PASSPORT" in entities
         assert "CN_EMAIL" in entities
+
+
+class TestImagePIIEntity:
+    """图像PII实体测试类"""
+
+    def test_to_dict_validates_as_response(self):
+        """测试to_dict输出的边界框对象可直接构建响应模型，并按相同格式输出"""
+        entity = ImagePIIEntity(
+            entity_type="CN_PHONE_NUMBER", text="13812345678", bbox=(1, 2, 30, 10), score=0.9
+        )
+        entity_dict = entity.to_dict()
+
+        response = ImagePIIEntityResponse(**entity_dict)
+
+        assert response.bbox == (1, 2, 30, 10)
+        assert response.model_dump() == entity_dict
+        assert ImagePIIEntityResponse(**{**entity_dict, "bbox": entity.bbox}) == response
@@ -4,10 +4,13 @@ Settings配置模块单元测试
 测试配置加载和解析功能。
 """
 
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
 import pytest
 from pydantic_settings import SettingsConfigDict
 
-from cn_pii_anonymization.config.settings import Settings
+from cn_pii_anonymization.config.settings import ScoreThresholdSettings, Settings
 
 
 class TestSettingsNameLists:
@@ -18,46 +21,105 @@ class TestSettingsNameLists:
         # 使用空的env_file配置来忽略.env文件，确保测试真正的默认值
         settings = Settings(_env_file=None)
         assert settings.name_allow_list == ""
-        assert settings.parsed_name_allow_list == []
+        assert settings.parsed_name_allow_list == ()
 
     def test_default_name_deny_list_empty(self):
         """测试默认deny_list为空"""
         settings = Settings(_env_file=None)
         assert settings.name_deny_list == ""
-        assert settings.parsed_name_deny_list == []
+        assert settings.parsed_name_deny_list == ()
 
     def test_parsed_name_allow_list_with_values(self, monkeypatch):
         """测试解析allow_list"""
         monkeypatch.setenv("NAME_ALLOW_LIST", "张三,李四,王五")
         settings = Settings()
-        assert settings.parsed_name_allow_list == ["张三", "李四", "王五"]
+        assert settings.parsed_name_allow_list == ("张三", "李四", "王五")
 
     def test_parsed_name_deny_list_with_values(self, monkeypatch):
         """测试解析deny_list"""
         monkeypatch.setenv("NAME_DENY_LIST", "赵六,钱七")
         settings = Settings()
-        assert settings.parsed_name_deny_list == ["赵六", "钱七"]
+        assert settings.parsed_name_deny_list == ("赵六", "钱七")
 
     def test_parsed_name_list_with_spaces(self, monkeypatch):
         """测试带空格的列表解析"""
         monkeypatch.setenv("NAME_ALLOW_LIST", " 张三 , 李四 , 王五 ")
         settings = Settings()
-        assert settings.parsed_name_allow_list == ["张三", "李四", "王五"]
+        assert settings.parsed_name_allow_list == ("张三", "李四", "王五")
 
     def test_parsed_name_list_with_empty_items(self, monkeypatch):
         """测试包含空项的列表解析"""
         monkeypatch.setenv("NAME_ALLOW_LIST", "张三,,李四,")
         settings = Settings()
-        assert settings.parsed_name_allow_list == ["张三", "李四"]
+        assert settings.parsed_name_allow_list == ("张三", "李四")
 
     def test_parsed_name_list_single_item(self, monkeypatch):
         """测试单个项目的列表"""
         monkeypatch.setenv("NAME_DENY_LIST", "单个名字")
         settings = Settings()
-        assert settings.parsed_name_deny_list == ["单个名字"]
+        assert settings.parsed_name_deny_list == ("单个名字",)
 
     def test_parsed_name_list_trailing_comma(self, monkeypatch):
         """测试末尾逗号"""
         monkeypatch.setenv("NAME_ALLOW_LIST", "张三,李四,")
         settings = Settings()
-        assert settings.parsed_name_allow_list == ["张三", "李四"]
+        assert settings.parsed_name_allow_list == ("张三", "李四")
+
+    def test_refresh_recomputes_parsed_name_list(self):
+        """测试refresh后重新解析姓名列表"""
+        settings = Settings.from_defaults()
+        assert settings.parsed_name_allow_list == ()
+
+        settings.name_allow_list = "张三,李四"
+        assert settings.parsed_name_allow_list == ()
+
+        settings.refresh()
+        assert settings.parsed_name_allow_list == ("张三", "李四")
+
+    def test_from_defaults_ignores_environment(self, monkeypatch):
+        """测试from_defaults不读取环境变量，仅应用显式覆盖"""
+        monkeypatch.setenv("NAME_ALLOW_LIST", "张三")
+        settings = Settings.from_defaults(name_deny_list="李四")
+        assert settings.parsed_name_allow_list == ()
+        assert settings.parsed_name_deny_list == ("李四",)
+
+    def test_refresh_reuses_unchanged_parsed_name_list(self):
+        """测试列表字符串未变时refresh后复用已解析的结果"""
+        settings = Settings.from_defaults(name_allow_list="张三,李四")
+        parsed = settings.parsed_name_allow_list
+
+        settings.refresh()
+        assert settings.parsed_name_allow_list is parsed
+
+    def test_log_file_path_cached_until_refresh(self):
+        """测试日志路径缓存，refresh后按新配置重建"""
+        settings = Settings.from_defaults()
+        assert settings.log_file_path is settings.log_file_path
+
+        settings.log_file = "other/app.log"
+        settings.refresh()
+        assert settings.log_file_path == Path("other/app.log")
+
+
+class TestScoreThresholdSettings:
+    """置信度阈值配置测试类"""
+
+    def test_get_threshold(self):
+        """测试按类型获取阈值，未配置类型回退到默认阈值"""
+        thresholds = ScoreThresholdSettings(default=0.4, cn_name=0.2)
+        assert thresholds.get_threshold("CN_NAME") == 0.2
+        assert thresholds.get_threshold("UNKNOWN") == 0.4
+        assert thresholds.to_dict()["default"] == 0.4
+
+    def test_frozen(self):
+        """测试阈值配置创建后不可修改"""
+        thresholds = ScoreThresholdSettings()
+        with pytest.raises(FrozenInstanceError):
+            thresholds.cn_name = 0.9
+
+    def test_threshold_getter(self):
+        """测试查表函数与get_threshold结果一致"""
+        thresholds = ScoreThresholdSettings(default=0.4, cn_name=0.2)
+        getter = thresholds.threshold_getter()
+        assert getter("CN_NAME", thresholds.default) == thresholds.get_threshold("CN_NAME")
+        assert getter("UNKNOWN", thresholds.default) == thresholds.get_threshold("UNKNOWN")